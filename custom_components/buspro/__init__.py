@@ -20,13 +20,14 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     EVENT_HOMEASSISTANT_STARTED,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from .pybuspro.buspro import Buspro
-from custom_components.buspro.scheduler import Scheduler
+from custom_components.buspro.scheduler import Scheduler, DEFAULT_READ_BUDGET
+from custom_components.buspro.snapshot import StateSnapshot
 from .helpers import signal_buspro_ready
 from homeassistant.util import dt
-from .const import CONF_TIME_BROADCAST, DATA_BUSPRO
+from .const import CONF_TIME_BROADCAST, CONF_READ_BUDGET, DATA_BUSPRO
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,7 +83,8 @@ CONFIG_SCHEMA = vol.Schema({
     DATA_BUSPRO: vol.Schema({
         vol.Required(CONF_BROADCAST_ADDRESS): cv.string,
         vol.Required(CONF_BROADCAST_PORT): cv.port,
-        vol.Optional(CONF_NAME, default=DEFAULT_CONF_NAME): cv.string
+        vol.Optional(CONF_NAME, default=DEFAULT_CONF_NAME): cv.string,
+        vol.Optional(CONF_READ_BUDGET, default=DEFAULT_READ_BUDGET): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
     })
 }, extra=vol.ALLOW_EXTRA)
 
@@ -96,19 +98,21 @@ async def _setup_buspro(hass: HomeAssistant, config_data: dict) -> bool:
         old_module = hass.data[DATA_BUSPRO]
         scheduler = old_module.scheduler
         time_broadcast = config_data.get(CONF_TIME_BROADCAST, True)
-        
+        read_budget = config_data.get(CONF_READ_BUDGET, DEFAULT_READ_BUDGET)
         
         host = config_data.get(CONF_BROADCAST_ADDRESS)
         port = config_data.get(CONF_BROADCAST_PORT)
-        await old_module.restart(host, port, time_broadcast)
+        await old_module.restart(host, port, time_broadcast, read_budget)
         
         return True
 
     host = config_data.get(CONF_BROADCAST_ADDRESS, DEFAULT_BROADCAST_ADDRESS)
     port = config_data.get(CONF_BROADCAST_PORT, DEFAULT_BROADCAST_PORT)
     time_broadcast = config_data.get(CONF_TIME_BROADCAST, True)
+    read_budget = config_data.get(CONF_READ_BUDGET, DEFAULT_READ_BUDGET)
 
-    module = BusproModule(hass, host, port, time_broadcast, existing_scheduler=scheduler)
+    module = BusproModule(hass, host, port, time_broadcast, existing_scheduler=scheduler, read_budget=read_budget)
+    await module.snapshot.async_load()
     await module.start()
     module.register_services()
     
@@ -145,18 +149,20 @@ async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         await module.restart(
             host=config_entry.data.get(CONF_BROADCAST_ADDRESS),
             port=config_entry.data.get(CONF_BROADCAST_PORT),
-            time_broadcast=config_entry.data.get(CONF_TIME_BROADCAST)
+            time_broadcast=config_entry.data.get(CONF_TIME_BROADCAST),
+            read_budget=config_entry.data.get(CONF_READ_BUDGET)
         )
         return True
 
 
 class BusproModule:
-    def __init__(self, hass, host, port, time_broadcast=True, existing_scheduler=None):
+    def __init__(self, hass, host, port, time_broadcast=True, existing_scheduler=None, read_budget=DEFAULT_READ_BUDGET):
         self.hass = hass
         self.connected = False        
         self.gateway_address_send_receive = ((host, port), ('', port))
         self.hdl = Buspro(hass, self.gateway_address_send_receive, self.hass.loop)        
-        self.scheduler = existing_scheduler or Scheduler(hass)
+        self.scheduler = existing_scheduler or Scheduler(hass, read_budget)
+        self.snapshot = StateSnapshot(hass)
         self.entity_lock = asyncio.Lock()
         self._time_sync_registered = False
         self._time_broadcast_enabled = time_broadcast
@@ -167,6 +173,21 @@ class BusproModule:
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self.stop)
         self.connected = True
         await self._handle_time_broadcaster()
+        self._start_warmup()
+
+    def _start_warmup(self):
+        """Start initial reads once Home Assistant is running, paced by the read budget."""
+        warmup = self.hdl.warmup
+        warmup.rate = self.scheduler.read_budget
+        if self.hass.is_running:
+            warmup.start()
+            return
+
+        @callback
+        def start_warmup(_event):
+            warmup.start()
+
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_warmup)
 
     async def _handle_time_broadcaster(self):
         """Handle time broadcaster based on configuration."""
@@ -192,7 +213,7 @@ class BusproModule:
         await self.hdl.stop()
         self.connected = False
 
-    async def restart(self, host=None, port=None, time_broadcast=None):
+    async def restart(self, host=None, port=None, time_broadcast=None, read_budget=None):
         """Restart HDL connection with optional new configuration."""
         if host is not None or port is not None:
             old_host, old_port = self.gateway_address_send_receive[0]
@@ -202,6 +223,9 @@ class BusproModule:
 
         if time_broadcast is not None:
             self._time_broadcast_enabled = time_broadcast
+
+        if read_budget is not None:
+            self.scheduler.read_budget = read_budget
         
         await self.stop()
         await asyncio.sleep(0.1)
@@ -202,6 +202,11 @@ class HDLBusproAlarmPanel(AlarmControlPanelEntity, RestoreEntity):
         """Update alarm panel state."""
         await self._device.read_security_status()
 
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
+
     @property
     def should_poll(self):
         """Return True if entity has to be polled for state."""
@@ -146,6 +146,11 @@ class BusproBinarySensor(BinarySensorEntity):
             return self._device.switch_status        
         return self._device.switch_status
 
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
+
     @property
     def should_poll(self):
         """No polling needed within Buspro unless explicitly set."""
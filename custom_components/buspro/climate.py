@@ -214,6 +214,11 @@ class BusproClimate(ClimateEntity):
         self._device.register_device_updated_cb(after_update_callback)    
 
 
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
+
     @property
     def should_poll(self):
         """Return False as we use scheduler instead of polling."""
@@ -5,7 +5,8 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 
-from .const import CONF_TIME_BROADCAST, DATA_BUSPRO
+from .const import CONF_TIME_BROADCAST, CONF_READ_BUDGET, DATA_BUSPRO
+from .scheduler import DEFAULT_READ_BUDGET
 
 from homeassistant.const import (
     CONF_BROADCAST_ADDRESS,
@@ -36,7 +37,11 @@ def _get_form_schema(defaults=None):
         vol.Optional(
             CONF_TIME_BROADCAST, 
             default=defaults.get(CONF_TIME_BROADCAST, True)
-        ): bool
+        ): bool,
+        vol.Optional(
+            CONF_READ_BUDGET,
+            default=defaults.get(CONF_READ_BUDGET, DEFAULT_READ_BUDGET)
+        ): vol.All(vol.Coerce(float), vol.Range(min=0.1))
     })
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DATA_BUSPRO):
@@ -86,7 +91,8 @@ class BusproOptionsFlowHandler(config_entries.OptionsFlow):
                 await module.restart(
                     host=user_input.get(CONF_BROADCAST_ADDRESS),
                     port=user_input.get(CONF_BROADCAST_PORT),
-                    time_broadcast=user_input.get(CONF_TIME_BROADCAST)
+                    time_broadcast=user_input.get(CONF_TIME_BROADCAST),
+                    read_budget=user_input.get(CONF_READ_BUDGET)
                 )
             
             return self.async_create_entry(title="", data=user_input)
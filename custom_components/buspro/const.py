@@ -3,4 +3,5 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 HUMIDITY = "humidity"
 CONF_INVERT = "invert" 
-CONF_TIME_BROADCAST = "time_broadcast"
\ No newline at end of file
+CONF_TIME_BROADCAST = "time_broadcast"
+CONF_READ_BUDGET = "read_budget"
\ No newline at end of file
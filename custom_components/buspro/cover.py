@@ -173,6 +173,11 @@ class HDLBusproCover(CoverEntity):
         """Stop the cover tilt movement."""
         await self._device.small_step_stop()
         
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
+
     @property
     def should_poll(self):
         """No polling needed within Buspro unless explicitly set."""
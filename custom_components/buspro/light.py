@@ -130,7 +130,7 @@ class BusproLight(LightEntity):
     @property
     def available(self):
         """Return True if entity is available."""
-        return self._hass.data[DATA_BUSPRO].connected
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
 
     @property
     def brightness(self):
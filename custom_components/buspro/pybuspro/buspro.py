@@ -4,14 +4,45 @@ import asyncio
 import logging
 
 from .helpers.enums import *
+from .core.telegram import address_key
+from .core.update_coalescer import UpdateCoalescer
+from .core.broadcast_freshness import BroadcastFreshnessTracker, BROADCAST_READ_OPERATE_CODES
+from .core.module_health import ModuleHealthMonitor
+from .core.warmup import WarmupOrchestrator
 from .transport.network_interface import NetworkInterface
+from .transport.transmit_queue import DEFAULT_FRAME_RATE, DEFAULT_FRAME_GAP
 _LOGGER = logging.getLogger(__name__)
 
+# operate code -> payload index holding the channel (switch, area, key) number
+CHANNEL_ADDRESSED_OPERATE_CODES = {
+    OperateCode.SingleChannelControlResponse: 0,
+    OperateCode.UniversalSwitchControlResponse: 0,
+    OperateCode.ReadStatusOfUniversalSwitchResponse: 0,
+    OperateCode.CurtainSwitchControlResponse: 0,
+    OperateCode.ReadStatusofCurtainSwitchResponse: 0,
+    OperateCode.FHMResponseReadFloorHeatingStatus: 0,
+    OperateCode.BroadcastTemperatureResponse: 0,
+    OperateCode.ReadTemperatureStatusResponse: 0,
+    OperateCode.ReadSecurityModuleResponse: 0,
+    OperateCode.ArmSecurityModuleResponse: 0,
+    OperateCode.ReadDryContactStatusResponse: 1,
+    OperateCode.ReadDryContactBroadcastStatusResponse: 1,
+    OperateCode.PanelControlResponse: 1,
+    OperateCode.ReadPanelStatusResponse: 1,
+}
+
+# status of all channels in one frame: payload[0] = count, payload[n] = channel n
+CHANNEL_STATUS_OPERATE_CODES = frozenset((
+    OperateCode.ReadStatusOfChannelsResponse,
+    OperateCode.BroadcastStatusOfUniversalSwitch,
+))
+
 # ip, port = gateway_address
 # subnet_id, device_id, channel = device_address
 class Buspro:
 
-    def __init__(self, hass, gateway_address_send_receive, loop_=None):
+    def __init__(self, hass, gateway_address_send_receive, loop_=None,
+                 frame_rate=DEFAULT_FRAME_RATE, frame_gap=DEFAULT_FRAME_GAP):
         self.loop = loop_ or asyncio.get_event_loop()
         self._hass = hass
         self.state_updater = None
@@ -20,10 +51,18 @@ class Buspro:
         self.logger = logging.getLogger("buspro.log")
         self.telegram_logger = logging.getLogger("buspro.telegram")
 
-        self.callback_all_messages = None        
-        self._telegram_received_cbs = {}
+        self.callback_all_messages = None
+        self.update_coalescer = UpdateCoalescer(self.loop)
+        self.broadcast_freshness = BroadcastFreshnessTracker(self.loop)
+        self.module_health = ModuleHealthMonitor(self.loop, self._module_availability_changed)
+        self._availability_cbs = {}         # address key -> [callback(available)]
+        self.warmup = WarmupOrchestrator(self.loop)
+        self._telegram_received_cbs = {}    # address key -> {callback: operate codes or None}
+        self._dispatch_index = {}           # address key -> (by operate code, by operate code and channel, all codes)
 
         self.gateway_address_send_receive = gateway_address_send_receive
+        self.frame_rate = frame_rate
+        self.frame_gap = frame_gap
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(f"Buspro logger level: {self.logger.getEffectiveLevel()}")
             _LOGGER.debug(f"Buspro telegram logger level: {self.telegram_logger.getEffectiveLevel()}")
@@ -39,33 +78,96 @@ class Buspro:
 
     # noinspection PyUnusedLocal
     async def start(self):
-        self.network_interface = NetworkInterface(self._hass, self.gateway_address_send_receive)
+        self.network_interface = NetworkInterface(self._hass, self.gateway_address_send_receive,
+                                                  self.frame_rate, self.frame_gap)
         self.network_interface.register_callback(self._callback_all_messages)
+        self.network_interface.register_telegram_filter(self._wants_telegram)
+        self.network_interface.register_telegram_sent_callback(self._telegram_sent)
         await self.network_interface.start()
         self.started = True
 
     async def stop(self):
+        self.warmup.stop()
         await self._stop_network_interface()
         self.started = False
 
+    def _wants_telegram(self, source_key):
+        """Return True if a telegram from source_key has any consumer."""
+        return (source_key in self._telegram_received_cbs
+                or self.callback_all_messages is not None
+                or self.telegram_logger.isEnabledFor(logging.DEBUG))
+
     def _callback_all_messages(self, telegram):
         if self.telegram_logger.isEnabledFor(logging.DEBUG):
             self.telegram_logger.debug(telegram)
 
         if self.callback_all_messages is not None:
             self.callback_all_messages(telegram)
-        
-        callbacks_to_call = []
-        
-        if telegram.source_address in self._telegram_received_cbs:
-            callbacks_to_call.extend(self._telegram_received_cbs[telegram.source_address])
-            
-#        if telegram.target_address in self._telegram_received_cbs:
-#            callbacks_to_call.extend(self._telegram_received_cbs[telegram.target_address])
-            
-        for callback in set(callbacks_to_call):
-            if telegram.operate_code is not OperateCode.BroadcastSystemDateandTimeEveryMinute:
-                callback(telegram)
+
+        self.module_health.response_received(telegram.source_key)
+
+        if telegram.operate_code is OperateCode.BroadcastSystemDateandTimeEveryMinute:
+            return
+
+        subscriptions = self._dispatch_index.get(telegram.source_key)
+        if subscriptions is None:
+            return
+
+        by_operate_code, by_channel, all_operate_codes = subscriptions
+        operate_code = telegram.operate_code
+        if operate_code in BROADCAST_READ_OPERATE_CODES:
+            self.broadcast_freshness.observe(telegram)
+
+        for callback in by_operate_code.get(operate_code, all_operate_codes):
+            callback(telegram)
+
+        channels = by_channel.get(operate_code)
+        if channels is not None:
+            self._dispatch_to_channels(telegram, channels)
+
+    @staticmethod
+    def _dispatch_to_channels(telegram, channels):
+        payload = telegram.payload
+        if not payload:
+            return
+
+        index = CHANNEL_ADDRESSED_OPERATE_CODES.get(telegram.operate_code)
+        if index is not None:
+            if len(payload) > index:
+                for callback in channels.get(payload[index], ()):
+                    callback(telegram)
+            return
+
+        # full status frame, update every subscribed channel in one pass
+        count = payload[0]
+        for channel, callbacks in channels.items():
+            if channel <= count:
+                for callback in callbacks:
+                    callback(telegram)
+
+    def _telegram_sent(self, telegram):
+        self.module_health.request_sent(telegram.target_key)
+
+    def _module_availability_changed(self, key, available):
+        for callback in tuple(self._availability_cbs.get(key, ())):
+            callback(available)
+
+    def register_availability_cb(self, availability_cb, device_address):
+        """Register callback(available) called when the module stops or starts responding."""
+        self._availability_cbs.setdefault(address_key(device_address), []).append(availability_cb)
+
+    def unregister_availability_cb(self, availability_cb, device_address):
+        key = address_key(device_address)
+        callbacks = self._availability_cbs.get(key)
+        if callbacks is None or availability_cb not in callbacks:
+            return
+        callbacks.remove(availability_cb)
+        if not callbacks:
+            del self._availability_cbs[key]
+
+    def is_module_available(self, device_address):
+        """Return False while the circuit breaker of the module is open."""
+        return self.module_health.is_available(address_key(device_address))
 
     async def _stop_network_interface(self):
         if self.network_interface is not None:
@@ -75,28 +177,53 @@ class Buspro:
     def register_telegram_received_all_messages_cb(self, telegram_received_cb):
         self.callback_all_messages = telegram_received_cb
 
-    def register_telegram_received_device_cb(self, telegram_received_cb, device_address):
-        """Registrace callbacku pro dané zařízení."""
-        if not isinstance(device_address, tuple):
-            device_address = tuple(device_address)
-        
-        if device_address not in self._telegram_received_cbs:
-            self._telegram_received_cbs[device_address] = []
-        
-        if telegram_received_cb not in self._telegram_received_cbs[device_address]:
-            self._telegram_received_cbs[device_address].append(telegram_received_cb)
-        
+    def register_telegram_received_device_cb(self, telegram_received_cb, device_address, operate_codes=None, channel=None):
+        """Registrace callbacku pro dané zařízení.
+
+        operate_codes limits the callback to the given opcodes, None means all.
+        With channel set, channel-addressed opcodes are delivered only when the
+        telegram carries that channel (switch, area, key) number.
+        """
+        key = address_key(device_address)
+        subscriptions = self._telegram_received_cbs.setdefault(key, {})
+        if operate_codes is not None:
+            operate_codes = frozenset(operate_codes)
+        subscriptions[telegram_received_cb] = (operate_codes, channel)
+        self._rebuild_dispatch_index(key)
+
     def unregister_telegram_received_device_cb(self, telegram_received_cb, device_address):
         """Zrušení registrace callbacku."""
-        if not isinstance(device_address, tuple):
-            device_address = tuple(device_address)
-        
-        if device_address in self._telegram_received_cbs:
-            try:
-                self._telegram_received_cbs[device_address].remove(telegram_received_cb)
-                
-                if not self._telegram_received_cbs[device_address]:
-                    del self._telegram_received_cbs[device_address]
-            except ValueError:                
-                pass
+        key = address_key(device_address)
+        subscriptions = self._telegram_received_cbs.get(key)
+        if subscriptions is None or telegram_received_cb not in subscriptions:
+            return
+
+        del subscriptions[telegram_received_cb]
+        if not subscriptions:
+            del self._telegram_received_cbs[key]
+        self._rebuild_dispatch_index(key)
+
+    def _rebuild_dispatch_index(self, key):
+        """Precompute callback tuples per opcode (and channel) for one device address."""
+        subscriptions = self._telegram_received_cbs.get(key)
+        if not subscriptions:
+            self._dispatch_index.pop(key, None)
+            return
+
+        all_operate_codes = tuple(cb for cb, (operate_codes, _) in subscriptions.items() if operate_codes is None)
+        by_operate_code = {}
+        by_channel = {}
+        for callback, (operate_codes, channel) in subscriptions.items():
+            for operate_code in operate_codes or ():
+                if channel is not None and (operate_code in CHANNEL_ADDRESSED_OPERATE_CODES
+                                            or operate_code in CHANNEL_STATUS_OPERATE_CODES):
+                    by_channel.setdefault(operate_code, {}).setdefault(channel, []).append(callback)
+                else:
+                    by_operate_code.setdefault(operate_code, []).append(callback)
 
+        self._dispatch_index[key] = (
+            {operate_code: tuple(callbacks) + all_operate_codes for operate_code, callbacks in by_operate_code.items()},
+            {operate_code: {channel: tuple(callbacks) for channel, callbacks in channels.items()}
+             for operate_code, channels in by_channel.items()},
+            all_operate_codes,
+        )
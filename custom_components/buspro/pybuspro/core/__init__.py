@@ -1 +1,4 @@
-﻿from .telegram import Telegram
+﻿from .telegram import Telegram, address_key
+from .broadcast_freshness import BroadcastFreshnessTracker
+from .module_health import ModuleHealthMonitor
+from .warmup import WarmupOrchestrator
@@ -0,0 +1,96 @@
+import logging
+
+from ..helpers.enums import OperateCode
+
+_LOGGER = logging.getLogger(__name__)
+
+# broadcast operate code -> (read operate code it answers, payload index of the channel or None for whole module)
+BROADCAST_READ_OPERATE_CODES = {
+    OperateCode.Broadcast12in1SensorStatusAutoResponse: (OperateCode.Read12in1SensorStatus, None),
+    OperateCode.BroadcastSensorsInOneStatusResponse: (OperateCode.ReadSensorsInOneStatus, None),
+    OperateCode.BroadcastTemperatureResponse: (OperateCode.ReadTemperatureStatus, 0),
+    OperateCode.BroadcastStatusOfUniversalSwitch: (OperateCode.ReadStatusOfUniversalSwitch, None),
+    OperateCode.ReadDryContactBroadcastStatusResponse: (OperateCode.ReadDryContactStatus, 1),
+}
+
+PERIOD_SMOOTHING = 0.2      # weight of the newest interval in the learned broadcast period
+
+
+class BroadcastState:
+    __slots__ = ("last_seen", "period", "count")
+
+    def __init__(self, now):
+        self.last_seen = now
+        self.period = None      # smoothed interval between broadcasts
+        self.count = 1
+
+
+class BroadcastFreshnessTracker:
+    """Remember when modules last broadcast the data a status read would return.
+
+    State is kept per (subnet, device, read operate code, channel), channel is
+    None for broadcasts covering the whole module. Read requests are matched
+    by their request key (subnet, device, operate code, payload) where the last
+    payload byte selects the channel.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._states = {}
+        self.observed_count = 0
+
+    def observe(self, telegram):
+        """Record a broadcast telegram, ignored for other operate codes."""
+        mapping = BROADCAST_READ_OPERATE_CODES.get(telegram.operate_code)
+        if mapping is None:
+            return
+        read_operate_code, channel_index = mapping
+        channel = None
+        if channel_index is not None:
+            payload = telegram.payload
+            if len(payload) <= channel_index:
+                return
+            channel = payload[channel_index]
+
+        subnet_id, device_id = telegram.source_address
+        key = (subnet_id, device_id, read_operate_code, channel)
+        now = self._loop.time()
+        self.observed_count += 1
+        state = self._states.get(key)
+        if state is None:
+            self._states[key] = BroadcastState(now)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Module {subnet_id}.{device_id} broadcasts {telegram.operate_code.name}")
+            return
+        interval = now - state.last_seen
+        state.period = interval if state.period is None else state.period + PERIOD_SMOOTHING * (interval - state.period)
+        state.last_seen = now
+        state.count += 1
+
+    def state_for(self, request_key):
+        """Return BroadcastState answering the read request or None."""
+        if not isinstance(request_key, tuple) or len(request_key) != 4:
+            return None
+        subnet_id, device_id, operate_code, payload = request_key
+        state = self._states.get((subnet_id, device_id, operate_code, None))
+        if state is None and payload:
+            state = self._states.get((subnet_id, device_id, operate_code, payload[-1]))
+        return state
+
+    def fresh_until(self, request_key, max_age):
+        """Time until which broadcast data replaces the read, None if it never did or is stale."""
+        state = self.state_for(request_key)
+        if state is None:
+            return None
+        until = state.last_seen + max_age
+        return until if until > self._loop.time() else None
+
+    def broadcast_period(self, request_key):
+        """Learned broadcast period in seconds for the read request or None."""
+        state = self.state_for(request_key)
+        return state.period if state is not None else None
+
+    @property
+    def broadcasting_count(self):
+        """Number of (module, data kind) pairs seen broadcasting."""
+        return len(self._states)
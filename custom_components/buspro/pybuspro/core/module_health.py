@@ -0,0 +1,142 @@
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_TIMEOUT = 5      # seconds without any telegram from the module after a request
+DEFAULT_FAILURE_THRESHOLD = 3     # consecutive unanswered requests before the breaker opens
+DEFAULT_BASE_BACKOFF = 30         # seconds, first open period
+DEFAULT_MAX_BACKOFF = 900         # seconds
+
+BROADCAST_KEY = 0xFFFF            # (255, 255) never answers as one module
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class ModuleHealth:
+    __slots__ = ("requests", "responses", "pending_since", "failures", "state", "open_until")
+
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+        self.pending_since = None   # time of the oldest unanswered request
+        self.failures = 0           # consecutive unanswered requests
+        self.state = STATE_CLOSED
+        self.open_until = None
+
+
+class ModuleHealthMonitor:
+    """Per-module response tracking with a circuit breaker.
+
+    Modules are keyed by the packed address key. Any telegram from a module
+    answers all requests sent to it. Timeouts are evaluated lazily when the
+    module is asked about, so there are no timers per request. After
+    failure_threshold unanswered requests the breaker opens for an
+    exponentially growing period; when it elapses one probe is allowed
+    (half open) and its answer closes the breaker again.
+    """
+
+    def __init__(self, loop, availability_changed_cb=None,
+                 response_timeout=DEFAULT_RESPONSE_TIMEOUT,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 base_backoff=DEFAULT_BASE_BACKOFF,
+                 max_backoff=DEFAULT_MAX_BACKOFF):
+        self._loop = loop
+        self._modules = {}
+        self.availability_changed_cb = availability_changed_cb
+        self.response_timeout = response_timeout
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.open_count = 0
+
+    def health(self, key):
+        """Return ModuleHealth of module key or None if nothing was sent to it yet."""
+        return self._modules.get(key)
+
+    def request_sent(self, key):
+        if key == BROADCAST_KEY:
+            return
+        health = self._modules.get(key)
+        if health is None:
+            health = self._modules[key] = ModuleHealth()
+        now = self._loop.time()
+        self._expire(key, health, now)
+        health.requests += 1
+        if health.pending_since is None:
+            health.pending_since = now
+
+    def response_received(self, key):
+        health = self._modules.get(key)
+        if health is None:
+            return
+        health.responses += 1
+        health.pending_since = None
+        health.failures = 0
+        if health.state != STATE_CLOSED:
+            health.state = STATE_CLOSED
+            health.open_until = None
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Module {key >> 8}.{key & 0xFF} responds again, circuit closed")
+            self._availability_changed(key, True)
+
+    def allow_request(self, key) -> bool:
+        """Return False while polling of the module should be suspended."""
+        health = self._modules.get(key)
+        if health is None:
+            return True
+        now = self._loop.time()
+        self._expire(key, health, now)
+        if health.state == STATE_CLOSED:
+            return True
+        if health.state == STATE_OPEN:
+            if now < health.open_until:
+                return False
+            # one probe, its answer closes the breaker
+            health.state = STATE_HALF_OPEN
+            return True
+        return health.pending_since is None
+
+    def retry_at(self, key):
+        """Time when allow_request may return True again, None if it does now."""
+        health = self._modules.get(key)
+        if health is None or health.state == STATE_CLOSED:
+            return None
+        if health.state == STATE_OPEN:
+            return health.open_until
+        if health.pending_since is not None:
+            return health.pending_since + self.response_timeout
+        return None
+
+    def is_available(self, key) -> bool:
+        health = self._modules.get(key)
+        if health is None:
+            return True
+        self._expire(key, health, self._loop.time())
+        return health.state == STATE_CLOSED
+
+    def _expire(self, key, health, now):
+        if health.pending_since is None or now - health.pending_since < self.response_timeout:
+            return
+        health.pending_since = None
+        health.failures += 1
+        if health.state == STATE_HALF_OPEN or health.failures >= self.failure_threshold:
+            self._open(key, health, now)
+
+    def _open(self, key, health, now):
+        exponent = max(0, health.failures - self.failure_threshold)
+        backoff = min(self.base_backoff * (2 ** exponent), self.max_backoff)
+        was_closed = health.state == STATE_CLOSED
+        health.state = STATE_OPEN
+        health.open_until = now + backoff
+        self.open_count += 1
+        if was_closed:
+            _LOGGER.warning(f"Module {key >> 8}.{key & 0xFF} does not respond, polling suspended")
+            self._availability_changed(key, False)
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Module {key >> 8}.{key & 0xFF} probe unanswered, next probe in {backoff}s")
+
+    def _availability_changed(self, key, available):
+        if self.availability_changed_cb is not None:
+            self.availability_changed_cb(key, available)
@@ -2,17 +2,75 @@
 from ..helpers.enums import DeviceType
 
 
+# payload layout inside an HDL datagram
+IDX_LENGTH = 16
+IDX_CONTENT = 25
+CONTENT_LENGTH_OFFSET = 11
+
+
+def address_key(address):
+    """Pack (subnet_id, device_id) into a single int key."""
+    return (address[0] << 8) | address[1]
+
+
 # DTO class
 class Telegram:
+    __slots__ = (
+        "udp_address",
+        "_payload",
+        "operate_code",
+        "source_device_type",
+        "udp_data",
+        "source_key",
+        "target_key",
+    )
+
     def __init__(self):
         self.udp_address = None
-        self.payload = None
+        self._payload = None
         self.operate_code = None
         self.source_device_type = DeviceType.PyBusPro
         self.udp_data = None
-        self.source_address = None
-        self.target_address = None
-        self.crc = None
+        self.source_key = None
+        self.target_key = None
+
+    @property
+    def payload(self):
+        """Payload, for received telegrams a lazily created view into udp_data."""
+        payload = self._payload
+        if payload is None and self.udp_data is not None:
+            udp_data = self.udp_data
+            content_length = udp_data[IDX_LENGTH] - CONTENT_LENGTH_OFFSET
+            payload = self._payload = memoryview(udp_data)[IDX_CONTENT:IDX_CONTENT + content_length]
+        return payload
+
+    @payload.setter
+    def payload(self, payload):
+        self._payload = payload
+
+    @property
+    def source_address(self):
+        key = self.source_key
+        return None if key is None else (key >> 8, key & 0xFF)
+
+    @source_address.setter
+    def source_address(self, address):
+        self.source_key = None if address is None else address_key(address)
+
+    @property
+    def target_address(self):
+        key = self.target_key
+        return None if key is None else (key >> 8, key & 0xFF)
+
+    @target_address.setter
+    def target_address(self, address):
+        self.target_key = None if address is None else address_key(address)
+
+    @property
+    def crc(self):
+        if self.udp_data is None:
+            return None
+        return bytes(self.udp_data[-2:])
 
     def __str__(self):
         """Return object as readable string."""
@@ -22,7 +80,7 @@ class Telegram:
             {"name": "source_device_type", "value": str(self.source_device_type)},
             {"name": "target_address", "value": self.target_address},
             {"name": "operate_code", "value": str(self.operate_code)},
-            {"name": "payload", "value": self.payload},
+            {"name": "payload", "value": None if self.payload is None else list(self.payload)},
             {"name": "udp_address", "value": self.udp_address},
             {"name": "udp_data", "value": str(self.udp_data)},
             {"name": "crc", "value": str(self.crc)},
@@ -30,4 +88,12 @@ class Telegram:
 
     def __eq__(self, other):
         """Equal operator."""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Telegram):
+            return NotImplemented
+        if (self.operate_code is not other.operate_code
+                or self.source_key != other.source_key
+                or self.target_key != other.target_key):
+            return False
+        if self.payload is None or other.payload is None:
+            return self.payload is other.payload
+        return bytes(self.payload) == bytes(other.payload)
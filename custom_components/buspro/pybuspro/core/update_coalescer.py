@@ -0,0 +1,47 @@
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UpdateCoalescer:
+    """Collect device updates during one event loop iteration and flush them in one task.
+
+    Repeated updates of the same device before the flush are merged, so a
+    broadcast touching many devices results in a single batch of HA writes.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._pending = {}      # device -> should_reschedule
+        self._flush_scheduled = False
+        self.requested_count = 0
+        self.flushed_count = 0
+        self.flush_batches = 0
+
+    @property
+    def saved_count(self):
+        """Number of updates merged into an already pending one."""
+        return self.requested_count - self.flushed_count - len(self._pending)
+
+    def device_updated(self, device, should_reschedule=True):
+        """Mark device dirty, flush is scheduled for the next loop iteration."""
+        self.requested_count += 1
+        self._pending[device] = self._pending.get(device, False) or should_reschedule
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        self.flushed_count += len(pending)
+        self.flush_batches += 1
+        self._loop.create_task(self._run(pending))
+
+    @staticmethod
+    async def _run(pending):
+        for device, should_reschedule in pending.items():
+            try:
+                await device._device_updated(should_reschedule)
+            except Exception as e:
+                _LOGGER.error(f"Error updating device {device.name}: {e}")
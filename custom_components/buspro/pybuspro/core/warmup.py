@@ -0,0 +1,129 @@
+import asyncio
+import logging
+
+from ..helpers.enums import TransmitPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_RATE = 10    # initial reads per second
+
+
+class WarmupOrchestrator:
+    """Issue the initial status reads of all devices as one paced pipeline.
+
+    Devices hand in their read control when they are created. Reads with the
+    same request key (subnet, device, operate code, payload) are sent once,
+    so all channels of one module share a single read. Nothing is sent before
+    start(), which is called when Home Assistant is running; then the queue is
+    drained at `rate` reads per second. Devices added later join the queue.
+    """
+
+    def __init__(self, loop, rate=DEFAULT_WARMUP_RATE):
+        self._loop = loop
+        self.rate = rate
+        self._queue = {}            # request key -> control, in arrival order
+        self._keys = set()          # all requested keys
+        self._warmed = set()        # keys answered by at least one device
+        self._waiting = {}          # device -> (request key, time requested)
+        self._task = None
+        self.started_at = None
+        self.finished_at = None
+        self.sent_count = 0
+        self.deduplicated_count = 0
+        self.first_state_count = 0
+        self.first_state_max = 0.0
+        self._first_state_total = 0.0
+
+    @property
+    def started(self):
+        return self.started_at is not None
+
+    def request_initial_read(self, device, control):
+        """Queue the first read of device, deduplicated by the control request key."""
+        key = control.request_key
+        if key is None:
+            return
+        self._waiting[device] = (key, self._loop.time())
+        if key in self._keys:
+            self.deduplicated_count += 1
+            return
+        self._keys.add(key)
+        self._queue[key] = control
+        self.finished_at = None
+        self._kick()
+
+    def start(self):
+        if self.started:
+            return
+        self.started_at = self._loop.time()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Warm-up started: {len(self._queue)} reads for {len(self._waiting)} devices")
+        self._kick()
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _kick(self):
+        if self.started and self._queue and self._task is None:
+            self._task = self._loop.create_task(self._run())
+
+    async def _run(self):
+        try:
+            while self._queue:
+                key = next(iter(self._queue))
+                control = self._queue.pop(key)
+                await control.send(TransmitPriority.BACKGROUND)
+                self.sent_count += 1
+                await asyncio.sleep(1 / self.rate)
+        finally:
+            self._task = None
+
+    def device_updated(self, device):
+        """Record first state of a waiting device."""
+        entry = self._waiting.pop(device, None)
+        if entry is None or not self.started:
+            return
+        key, requested_at = entry
+        now = self._loop.time()
+        elapsed = now - max(requested_at, self.started_at)
+        self.first_state_count += 1
+        self._first_state_total += elapsed
+        if elapsed > self.first_state_max:
+            self.first_state_max = elapsed
+        self._warmed.add(key)
+
+        if not self._waiting and not self._queue and self.finished_at is None:
+            self.finished_at = now
+            warmed, total = self.modules_progress
+            _LOGGER.info(f"Warm-up finished: {warmed}/{total} modules answered, "
+                         f"first state after {self.first_state_average:.2f}s on average, {self.first_state_max:.2f}s max")
+
+    @property
+    def first_state_average(self):
+        """Average time in seconds from warm-up start to the first state of a device."""
+        return self._first_state_total / self.first_state_count if self.first_state_count else 0.0
+
+    @property
+    def modules_progress(self):
+        """(modules with an answered read, modules requested)."""
+        return len({key[:2] for key in self._warmed}), len({key[:2] for key in self._keys})
+
+    @property
+    def reads_progress(self):
+        """(answered reads, requested reads)."""
+        return len(self._warmed), len(self._keys)
+
+    def stats(self):
+        warmed, total = self.modules_progress
+        return {
+            "modules_warmed": warmed,
+            "modules_total": total,
+            "reads_sent": self.sent_count,
+            "reads_deduplicated": self.deduplicated_count,
+            "reads_queued": len(self._queue),
+            "devices_waiting": len(self._waiting),
+            "first_state_average": self.first_state_average,
+            "first_state_max": self.first_state_max,
+        }
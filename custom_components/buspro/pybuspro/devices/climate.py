@@ -9,6 +9,12 @@ from ..helpers.generics import Generics
 
 _LOGGER = logging.getLogger(__name__)
 
+CLIMATE_OPERATE_CODES = (
+    OperateCode.DLPReadFloorHeatingStatusResponse,
+    OperateCode.DLPControlFloorHeatingStatusResponse,
+    OperateCode.FHMResponseReadFloorHeatingStatus,
+)
+
 class ClimateDeviceType(Enum):
     """HDL Buspro climate device type."""
     PANEL = "panel"
@@ -46,8 +52,8 @@ class Climate(Device):
         self._timer_enabled = None
         self._watering_time = 0
 
-        self.register_telegram_received_cb(self._telegram_received_cb)
-        self._hass.loop.create_task(self.read_status())
+        self.register_telegram_received_cb(self._telegram_received_cb, CLIMATE_OPERATE_CODES, channel_number)
+        self._initialize_state()
 
     def _telegram_received_cb(self, telegram):
         if telegram.operate_code == OperateCode.DLPReadFloorHeatingStatusResponse:
@@ -59,10 +65,9 @@ class Climate(Device):
             self._day_temperature = telegram.payload[5]
             self._night_temperature = telegram.payload[6]
             self._away_temperature = telegram.payload[7]
-            self._call_device_updated()
+            self._notify_if_changed()
 
         elif telegram.operate_code == OperateCode.DLPControlFloorHeatingStatusResponse:
-            success_or_fail = telegram.payload[0]
             self._temperature_type = telegram.payload[1]
             self._status = telegram.payload[2]
             self._mode = telegram.payload[3]
@@ -70,10 +75,7 @@ class Climate(Device):
             self._day_temperature = telegram.payload[5]
             self._night_temperature = telegram.payload[6]
             self._away_temperature = telegram.payload[7]
-            self._call_device_updated()
-
-            if success_or_fail == SuccessOrFailure.Success:
-                self._call_device_updated()
+            self._notify_if_changed()
 
         elif telegram.operate_code == OperateCode.FHMResponseReadFloorHeatingStatus:
             if self._channel_number is not None and self._channel_number == telegram.payload[0]:
@@ -107,7 +109,7 @@ class Climate(Device):
                               f"current temperature {self._current_temperature} (raw byte 0x{temp_byte:02x}), status {self._status}  mode {self._mode}, working type {self._work_type}, "
                               f"normal temperature {self._normal_temperature}, day temperature {self._day_temperature}, "
                               f"night temperature {self._night_temperature}, away temperature {self._away_temperature} valve status {self._valve_status}")
-                self._call_device_updated()
+                self._notify_if_changed()
 
         # elif telegram.operate_code == OperateCode.BroadcastTemperatureResponse:
         #     if self._channel_number is not None and self._channel_number == telegram.payload[0]:
@@ -117,7 +119,52 @@ class Climate(Device):
         #         self._call_device_updated(should_reschedule=False)  # Don't reset scheduler for broadcast updates
         #         _LOGGER.debug(f"Broadcast temperature response processed for device {self._device_address} channel {self._channel_number}")
 
+    def _notify_if_changed(self):
+        """Call device updated only if any reported climate value changed."""
+        values = {
+            "temperature_type": self._temperature_type,
+            "current_temperature": self._current_temperature,
+            "status": self._status,
+            "mode": self._mode,
+            "work_type": self._work_type,
+            "normal_temperature": self._normal_temperature,
+            "day_temperature": self._day_temperature,
+            "night_temperature": self._night_temperature,
+            "away_temperature": self._away_temperature,
+            "valve_status": self._valve_status,
+        }
+        if self._values_changed(values):
+            self._call_device_updated()
+
+    @property
+    def snapshot_key(self):
+        return f"climate.{self._channel_number}"
+
+    def snapshot_state(self):
+        return {
+            "temperature_type": self._temperature_type,
+            "current_temperature": self._current_temperature,
+            "status": self._status,
+            "mode": self._mode,
+            "work_type": self._work_type.value if isinstance(self._work_type, WorkType) else None,
+            "normal_temperature": self._normal_temperature,
+            "day_temperature": self._day_temperature,
+            "night_temperature": self._night_temperature,
+            "away_temperature": self._away_temperature,
+            "valve_status": self._valve_status,
+        }
+
+    def restore_snapshot(self, state):
+        work_type = state.get("work_type")
+        if work_type is not None:
+            self._work_type = WorkType(work_type)
+        for field in ("temperature_type", "current_temperature", "status", "mode", "normal_temperature",
+                      "day_temperature", "night_temperature", "away_temperature", "valve_status"):
+            if state.get(field) is not None:
+                setattr(self, f"_{field}", state[field])
+
     async def _controlFHM(self) -> None:
+        self._forget_reported_values()
         if self._device_type == ClimateDeviceType.FLOOR_HEATING:
             control = _FHMControlFloorHeatingStatus(self._hass, self._device_address)
             control.work_type = self._work_type
@@ -242,15 +289,20 @@ class Climate(Device):
             return False
         return self._work_type in [WorkType.HEATING_POWER, WorkType.COOLING_POWER]
 
-    async def read_status(self):
-        """Read status from the device."""
+    def _read_status_control(self):
         if self._device_type == ClimateDeviceType.FLOOR_HEATING:
-            fhmrfhs = _FHMReadFloorHeatingStatus(self._hass, self._device_address) 
-            fhmrfhs.channel_number = self._channel_number     
-            await fhmrfhs.send()                
+            fhmrfhs = _FHMReadFloorHeatingStatus(self._hass, self._device_address)
+            fhmrfhs.channel_number = self._channel_number
+            return fhmrfhs
         elif self._device_type == ClimateDeviceType.DLP:
-            rfhs = _ReadFloorHeatingStatus(self._hass, self._device_address) 
-            await rfhs.send()
+            return _ReadFloorHeatingStatus(self._hass, self._device_address)
+        return None
+
+    async def read_status(self):
+        """Read status from the device."""
+        control = self._read_status_control()
+        if control is not None:
+            await control.send()
 
     async def set_work_type(self, work_type: WorkType) -> None:
         """Set work type for floor heating."""
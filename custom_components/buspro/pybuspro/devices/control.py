@@ -3,10 +3,12 @@ import logging
 from custom_components.buspro.const import DATA_BUSPRO
 
 from ..core.telegram import Telegram
-from ..helpers.enums import OperateCode
+from ..helpers.enums import OperateCode, TransmitPriority
 _LOGGER = logging.getLogger(__name__)
 
 class _Control:
+    priority = TransmitPriority.USER
+
     def __init__(self, hass, device_address):
         self._hass = hass
         self.subnet_id = device_address[0]
@@ -181,10 +183,19 @@ class _Control:
     def telegram(self):
         return self.build_telegram_from_control(self)
 
-    async def send(self):
-        """Send telegram through network interface."""
+    @property
+    def request_key(self):
+        """(subnet, device, operate code, payload) identifying the request on the wire."""
+        telegram = self.telegram
+        if telegram is None:
+            return None
+        return self.subnet_id, self.device_id, telegram.operate_code, tuple(telegram.payload)
+
+    async def send(self, priority=None):
+        """Send telegram through network interface, priority defaults to the one of the control."""
         try:
-            await self._hass.data[DATA_BUSPRO].hdl.network_interface.send_telegram(self.telegram)
+            await self._hass.data[DATA_BUSPRO].hdl.network_interface.send_telegram(
+                self.telegram, self.priority if priority is None else priority)
             
         except AttributeError as e:
             if self.telegram is None:
@@ -228,6 +239,8 @@ class _SceneControl(_Control):
 
 
 class _ReadStatusOfChannels(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         # no more properties
@@ -242,35 +255,47 @@ class _UniversalSwitch(_Control):
 
 
 class _ReadStatusOfUniversalSwitch(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
 
         self.switch_number = None
 
 class _ReadStatusOfSwitch(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
 
 
 class _Read12in1SensorStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         # no more properties
 
 
 class _ReadSensorsInOneStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         # no more properties
 
 
 class _ReadTemperatureStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         self.channel_number = None
 
 
 class _ReadFloorHeatingStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         # no more properties
@@ -290,6 +315,8 @@ class _ControlFloorHeatingStatus(_Control):
 
 
 class _ReadDryContactStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
 
@@ -306,6 +333,8 @@ class _PanelControl(_Control):
         self.key_status = None
 
 class _ReadPanelStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
                 
@@ -320,6 +349,8 @@ class _CurtainSwitchControl(_Control):
         self.state = None
 
 class _CurtainReadStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
                         
@@ -327,6 +358,8 @@ class _CurtainReadStatus(_Control):
         
 
 class _ReadSecurityModule(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
                         
@@ -352,6 +385,8 @@ class _ModifySystemDateandTime(_Control):
         self.custom_datetime = None
 
 class _BroadcastSystemDateandTimeEveryMinute(_Control):
+    priority = TransmitPriority.BACKGROUND
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         self.custom_datetime = None
@@ -359,6 +394,8 @@ class _BroadcastSystemDateandTimeEveryMinute(_Control):
 
 
 class _FHMReadFloorHeatingStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)
         self.channel_number = None
@@ -379,26 +416,36 @@ class _FHMControlFloorHeatingStatus(_Control):
 
 
 class _ReadVoltageStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)        
         self.channel_number = None
 
 class _ReadCurrentStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)        
         self.channel_number = None
 
 class _ReadPowerStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)        
         self.channel_number = None
 
 class _ReadPowerFactorStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)        
         self.channel_number = None
 
 class _ReadElectricityStatus(_Control):
+    priority = TransmitPriority.POLL
+
     def __init__(self, hass, device_address):
         super().__init__(hass, device_address)        
         self.channel_number = None
@@ -9,6 +9,8 @@ from .device import Device
 
 _LOGGER = logging.getLogger(__name__)
 
+COVER_OPERATE_CODES = frozenset((OperateCode.CurtainSwitchControlResponse, OperateCode.ReadStatusofCurtainSwitchResponse))
+
 class CoverCommand(IntEnum):
     """Cover control commands."""
     STOP = 0
@@ -24,6 +26,8 @@ class CoverStatus(IntEnum):
     OPEN = 1
     CLOSE = 2
 
+COVER_RESPONSE_CHANNELS = frozenset((CoverCommand.STOP, CoverCommand.OPEN, CoverCommand.CLOSE))
+
 class Cover(Device):
     """HDL Buspro cover device."""
     
@@ -40,19 +44,23 @@ class Cover(Device):
         self._position = 0
         self._status = CoverStatus.STOP
         self._hass = hass
-        self.register_telegram_received_cb(self._telegram_received_cb)
+        self.register_telegram_received_cb(self._telegram_received_cb, COVER_OPERATE_CODES, channel)
 
     def _telegram_received_cb(self, telegram):
         """Handle received telegram."""        
-        if telegram.operate_code in [OperateCode.CurtainSwitchControlResponse, OperateCode.ReadStatusofCurtainSwitchResponse]:
-            if telegram.payload[0] == self._channel and telegram.payload[0] in [CoverCommand.STOP, CoverCommand.OPEN, CoverCommand.CLOSE]:
+        if telegram.operate_code in COVER_OPERATE_CODES:
+            if telegram.payload[0] == self._channel and telegram.payload[0] in COVER_RESPONSE_CHANNELS:
                 self._status = CoverStatus(telegram.payload[1])
                 self._call_device_updated()
 
+    def _read_status_control(self):
+        csc = _CurtainReadStatus(self._hass, self._device_address)
+        csc.channel = self._channel
+        return csc
+
     async def read_cover_status(self):
         """Read current status from device."""
-        csc = _CurtainReadStatus(self._hass, self._device_address)        
-        csc.channel = self._channel
+        csc = self._read_status_control()
         await csc.send()
 
     async def _send_command(self, command: CoverCommand):
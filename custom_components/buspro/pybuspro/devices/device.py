@@ -4,6 +4,7 @@ from custom_components.buspro.const import DATA_BUSPRO
 
 
 from .control import _ReadStatusOfChannels
+from ..helpers.enums import TransmitPriority
 
 
 class Device(object):
@@ -14,19 +15,35 @@ class Device(object):
         self._hass = hass
         self._name = name
         self.device_updated_cbs = []
+        self._reported_values = {}  # field -> value at last device updated call
 
     @property
     def name(self):
         return self._name
 
-    def register_telegram_received_cb(self, telegram_received_cb):
-        self._hass.data[DATA_BUSPRO].hdl.register_telegram_received_device_cb(
+    @property
+    def available(self):
+        """False while the module does not respond to requests."""
+        return self._hass.data[DATA_BUSPRO].hdl.is_module_available(self._device_address)
+
+    def register_telegram_received_cb(self, telegram_received_cb, operate_codes=None, channel=None):
+        """Register telegram callback, optionally only for given operate codes and channel."""
+        hdl = self._hass.data[DATA_BUSPRO].hdl
+        hdl.register_telegram_received_device_cb(
             telegram_received_cb, 
-            self._device_address
+            self._device_address,
+            operate_codes,
+            channel
         )
+        hdl.register_availability_cb(self._availability_changed, self._device_address)
 
     def unregister_telegram_received_cb(self, telegram_received_cb):
-        self._buspro.unregister_telegram_received_device_cb(telegram_received_cb, self._device_address)
+        hdl = self._hass.data[DATA_BUSPRO].hdl
+        hdl.unregister_telegram_received_device_cb(telegram_received_cb, self._device_address)
+        hdl.unregister_availability_cb(self._availability_changed, self._device_address)
+
+    def _availability_changed(self, available):
+        self._call_device_updated(should_reschedule=False)
 
     def register_device_updated_cb(self, device_updated_cb):
         """Register device updated callback."""
@@ -36,6 +53,16 @@ class Device(object):
         """Unregister device updated callback."""
         self.device_updated_cbs.remove(device_updated_cb)
 
+    def _read_status_control(self):
+        """Return control reading the device status, None if the device cannot be read."""
+        return None
+
+    @property
+    def read_status_key(self):
+        """Wire identity of the status read, devices with equal keys are refreshed by one read."""
+        control = self._read_status_control()
+        return control.request_key if control is not None else None
+
     async def _device_updated(self, should_reschedule=True):
         """Device update callback with scheduler reset flag."""
         for device_updated_cb in self.device_updated_cbs:            
@@ -44,17 +71,69 @@ class Device(object):
     async def _send_telegram(self, telegram):
         await self._buspro.network_interface.send_telegram(telegram)
 
-    def _call_device_updated(self, should_reschedule=True):
-        """Call device updated with scheduler reset flag."""
-        asyncio.ensure_future(self._device_updated(should_reschedule), loop=self._hass.data[DATA_BUSPRO].hdl.loop)
+    def _values_changed(self, values, deadbands=None):
+        """Return True if any value differs from the last reported one by more than its deadband.
+
+        On change all given values become the new reported baseline.
+        """
+        reported = self._reported_values
+        changed = False
+        for field, value in values.items():
+            if field not in reported:
+                changed = True
+                break
+            previous = reported[field]
+            if value == previous:
+                continue
+            deadband = deadbands.get(field) if deadbands else None
+            if (deadband and isinstance(value, (int, float)) and isinstance(previous, (int, float))
+                    and abs(value - previous) <= deadband):
+                continue
+            changed = True
+            break
+
+        if changed:
+            reported.update(values)
+        return changed
+
+    def _forget_reported_values(self):
+        """Drop change detection baseline, next received state is always reported."""
+        self._reported_values.clear()
 
-    def _call_read_current_status_of_channels(self, run_from_init=False):
+    @property
+    def snapshot_key(self):
+        """Identity of the device within its module in the state snapshot, None if not persisted."""
+        return None
+
+    def snapshot_state(self):
+        """Return last known state as a JSON serialisable dict."""
+        return {}
+
+    def restore_snapshot(self, state):
+        """Hydrate device from a dict returned by snapshot_state()."""
+
+    def _call_device_updated(self, should_reschedule=True):
+        """Call device updated with scheduler reset flag, batched per loop iteration."""
+        module = self._hass.data[DATA_BUSPRO]
+        module.snapshot.device_updated(self)
+        module.hdl.warmup.device_updated(self)
+        module.hdl.update_coalescer.device_updated(self, should_reschedule)
+
+    def _initialize_state(self):
+        """Hydrate from the persisted snapshot, then verify it with the first read from the bus."""
+        self._hass.data[DATA_BUSPRO].snapshot.restore(self)
+        self._request_initial_read()
+
+    def _request_initial_read(self):
+        """Queue the first status read in the warm-up pipeline, shared by devices of one module."""
+        control = self._read_status_control()
+        if control is not None:
+            self._hass.data[DATA_BUSPRO].hdl.warmup.request_initial_read(self, control)
+
+    def _call_read_current_status_of_channels(self):
         async def read_current_state_of_channels():
-            if run_from_init:
-                await asyncio.sleep(5)
-            
             read_status_of_channels = _ReadStatusOfChannels(self._hass, self._device_address)
-            await read_status_of_channels.send()
+            await read_status_of_channels.send(TransmitPriority.CONFIRMATION)
 
         asyncio.ensure_future(
             read_current_state_of_channels(), 
@@ -3,6 +3,12 @@ from .device import Device
 from ..helpers.enums import *
 from ..helpers.generics import Generics
 
+LIGHT_OPERATE_CODES = (
+    OperateCode.SingleChannelControlResponse,
+    OperateCode.ReadStatusOfChannelsResponse,
+    OperateCode.SceneControlResponse,
+)
+
 
 class Light(Device):
     def __init__(self, hass, device_address, channel_number, name="", delay_read_current_state_seconds=0):
@@ -14,8 +20,8 @@ class Light(Device):
         self._channel_number = channel_number
         self._brightness = 0
         self._previous_brightness = None
-        self.register_telegram_received_cb(self._telegram_received_cb)
-        self._call_read_current_status_of_channels(run_from_init=True)
+        self.register_telegram_received_cb(self._telegram_received_cb, LIGHT_OPERATE_CODES, channel_number)
+        self._initialize_state()
 
     def _telegram_received_cb(self, telegram):
 
@@ -29,12 +35,14 @@ class Light(Device):
             if channel == self._channel_number:
                 self._brightness = brightness
                 self._set_previous_brightness(self._brightness)
-                self._call_device_updated()
+                if self._values_changed({"brightness": brightness}):
+                    self._call_device_updated()
         elif telegram.operate_code == OperateCode.ReadStatusOfChannelsResponse:
             if self._channel_number <= telegram.payload[0]:
                 self._brightness = telegram.payload[self._channel_number]
                 self._set_previous_brightness(self._brightness)
-                self._call_device_updated()
+                if self._values_changed({"brightness": self._brightness}):
+                    self._call_device_updated()
         elif telegram.operate_code == OperateCode.SceneControlResponse:
             self._call_read_current_status_of_channels()
 
@@ -49,14 +57,28 @@ class Light(Device):
     async def set_brightness(self, intensity, running_time_seconds=0):
         await self._set(intensity, running_time_seconds)
 
+    def _read_status_control(self):
+        return _ReadStatusOfChannels(self._hass, self._device_address)
+
     async def read_status(self):
-        rsoch = _ReadStatusOfChannels(self._hass, self._device_address)        
+        rsoch = self._read_status_control()
         await rsoch.send()
 
     @property
     def device_identifier(self):
         return f"{self._device_address}-{self._channel_number}"
 
+    @property
+    def snapshot_key(self):
+        return f"light.{self._channel_number}"
+
+    def snapshot_state(self):
+        return {"brightness": self._brightness, "previous_brightness": self._previous_brightness}
+
+    def restore_snapshot(self, state):
+        self._brightness = int(state["brightness"])
+        self._previous_brightness = state.get("previous_brightness")
+
     @property
     def supports_brightness(self):
         return True
@@ -78,6 +100,7 @@ class Light(Device):
 
     async def _set(self, intensity, running_time_seconds):
         self._brightness = intensity
+        self._forget_reported_values()
         self._set_previous_brightness(self._brightness)
 
         generics = Generics()
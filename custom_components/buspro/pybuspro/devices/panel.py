@@ -6,6 +6,7 @@ from .control import _PanelControl, _ReadPanelStatus
 _LOGGER = logging.getLogger(__name__)
 
 PANEL_CONTROL_REMARK = 18
+PANEL_OPERATE_CODES = frozenset((OperateCode.ReadPanelStatusResponse, OperateCode.PanelControlResponse))
 
 class Panel(Device):
     """HDL panel device for handling button presses and other panel-related operations."""
@@ -19,12 +20,12 @@ class Panel(Device):
         self._is_on = False
         self._callbacks = []
         
-        self.register_telegram_received_cb(self._telegram_received_cb)
+        self.register_telegram_received_cb(self._telegram_received_cb, PANEL_OPERATE_CODES, channel_number)
 
     def _telegram_received_cb(self, telegram):
         """Handle received telegrams from panel."""
         
-        if telegram.operate_code in [OperateCode.ReadPanelStatusResponse,OperateCode.PanelControlResponse]:
+        if telegram.operate_code in PANEL_OPERATE_CODES:
             if telegram.payload[0] == PANEL_CONTROL_REMARK and self._channel_number == telegram.payload[1]:
                 self._is_on = telegram.payload[2] == 1
                 if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -53,11 +54,15 @@ class Panel(Device):
         self._is_on = False
         self._call_device_updated()
 
-    async def read_status(self):
-        """Read channel status."""
-        rps = _ReadPanelStatus(self._hass, self._device_address)        
+    def _read_status_control(self):
+        rps = _ReadPanelStatus(self._hass, self._device_address)
         rps.key_number = self._channel_number
         rps.remark = PANEL_CONTROL_REMARK
+        return rps
+
+    async def read_status(self):
+        """Read channel status."""
+        rps = self._read_status_control()
         await rps.send()
 
     @property
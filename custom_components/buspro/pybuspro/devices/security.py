@@ -15,6 +15,8 @@ from .device import Device
 
 _LOGGER = logging.getLogger(__name__)
 
+SECURITY_OPERATE_CODES = frozenset((OperateCode.ReadSecurityModuleResponse, OperateCode.ArmSecurityModuleResponse))
+
 class SecurityStatus(IntEnum):
     """Security module status codes."""
     VACATION = 1      # Vacation mode
@@ -42,16 +44,16 @@ class Security(Device):
         self._device_address = device_address
         self._hass = hass
 
-        self.register_telegram_received_cb(self._telegram_received_cb)
+        self.register_telegram_received_cb(self._telegram_received_cb, SECURITY_OPERATE_CODES, area_id)
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(f"Initialized security device {device_address} for area {area_id}")
-        self._hass.loop.create_task(self.read_security_status())
+        self._initialize_state()
         
         
 
     def _telegram_received_cb(self, telegram):
         """Handle received telegram."""        
-        if telegram.operate_code in [OperateCode.ReadSecurityModuleResponse, OperateCode.ArmSecurityModuleResponse]:
+        if telegram.operate_code in SECURITY_OPERATE_CODES:
             if len(telegram.payload) > 1 and telegram.payload[0] == self._area_id and telegram.payload[1] >= 1 and telegram.payload[1] <= 6:
                 self._status = SecurityStatus(telegram.payload[1])
                 self._call_device_updated()
@@ -59,10 +61,14 @@ class Security(Device):
                 _LOGGER.error(f"Received invalid security status: {telegram.payload[1]}")
         
 
-    async def read_security_status(self):
-        """Read current security status from device."""
+    def _read_status_control(self):
         rsm = _ReadSecurityModule(self._hass, self._device_address)
         rsm.area = self._area_id
+        return rsm
+
+    async def read_security_status(self):
+        """Read current security status from device."""
+        rsm = self._read_status_control()
         await rsm.send()
 
 
@@ -87,6 +93,16 @@ class Security(Device):
         await control.send()
         
 
+    @property
+    def snapshot_key(self):
+        return f"security.{self._area_id}"
+
+    def snapshot_state(self):
+        return {"status": int(self._status)} if self._status is not None else {}
+
+    def restore_snapshot(self, state):
+        self._status = SecurityStatus(state["status"])
+
     @property
     def status(self) -> SecurityStatus:
         """Get current security status."""
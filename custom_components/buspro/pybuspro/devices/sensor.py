@@ -10,9 +10,60 @@ from ..helpers.enums import *
 
 _LOGGER = logging.getLogger(__name__)
 
+TWELVE_IN_ONE_OPERATE_CODES = frozenset((OperateCode.Read12in1SensorStatusResponse, OperateCode.Broadcast12in1SensorStatusAutoResponse))
+SENSORS_IN_ONE_OPERATE_CODES = frozenset((OperateCode.ReadSensorsInOneStatusResponse, OperateCode.BroadcastSensorsInOneStatusResponse))
+TEMPERATURE_OPERATE_CODES = frozenset((OperateCode.BroadcastTemperatureResponse, OperateCode.ReadTemperatureStatusResponse))
+UNIVERSAL_SWITCH_OPERATE_CODES = frozenset((OperateCode.ReadStatusOfUniversalSwitchResponse, OperateCode.UniversalSwitchControlResponse))
+DRY_CONTACT_OPERATE_CODES = frozenset((OperateCode.ReadDryContactStatusResponse, OperateCode.ReadDryContactBroadcastStatusResponse))
+SENSOR_OPERATE_CODES = (
+    TWELVE_IN_ONE_OPERATE_CODES
+    | SENSORS_IN_ONE_OPERATE_CODES
+    | TEMPERATURE_OPERATE_CODES
+    | UNIVERSAL_SWITCH_OPERATE_CODES
+    | DRY_CONTACT_OPERATE_CODES
+    | {
+        OperateCode.DLPReadFloorHeatingStatusResponse,
+        OperateCode.BroadcastStatusOfUniversalSwitch,
+        OperateCode.ReadVoltageResponse,
+        OperateCode.ReadCurrentResponse,
+        OperateCode.ReadPowerStatusResponse,
+        OperateCode.ReadPowerFactorStatusResponse,
+        OperateCode.ReadElectricityStatusResponse,
+    }
+)
+
+# sensor type -> attribute holding its value, used for change detection
+SENSOR_TYPE_ATTRIBUTES = {
+    SensorType.TEMPERATURE: "_current_temperature",
+    SensorType.HUMIDITY: "_current_humidity",
+    SensorType.ILLUMINANCE: "_brightness",
+    SensorType.MOTION: "_motion_sensor",
+    SensorType.SONIC: "_sonic",
+    SensorType.DRY_CONTACT: "_switch_status",
+    SensorType.DRY_CONTACT_1: "_dry_contact_1_status",
+    SensorType.DRY_CONTACT_2: "_dry_contact_2_status",
+    SensorType.UNIVERSAL_SWITCH: "_universal_switch_status",
+    SensorType.CURRENT: "_current",
+    SensorType.VOLTAGE: "_voltage",
+    SensorType.ACTIVE_POWER: "_active_power",
+    SensorType.REACTIVE_POWER: "_reactive_power",
+    SensorType.APPARENT_POWER: "_apparent_power",
+    SensorType.POWER_FACTOR: "_power_factor",
+    SensorType.ENERGY: "_energy",
+}
+
+# power meter sensor type -> per channel read control
+SENSOR_TYPE_READ_CONTROLS = {
+    SensorType.VOLTAGE: _ReadVoltageStatus,
+    SensorType.CURRENT: _ReadCurrentStatus,
+    SensorType.ACTIVE_POWER: _ReadPowerStatus,
+    SensorType.POWER_FACTOR: _ReadPowerFactorStatus,
+    SensorType.ENERGY: _ReadElectricityStatus,
+}
+
 class Sensor(Device):
     def __init__(self, hass, device_address, device_family=None, sensor_type=None, universal_switch_number=None, channel_number=None, device=None,
-                 switch_number=None, name="", delay_read_current_state_seconds=0):
+                 switch_number=None, name="", delay_read_current_state_seconds=0, deadbands=None):
         super().__init__(hass, device_address, name)
 
         self._hass = hass
@@ -23,6 +74,8 @@ class Sensor(Device):
         self._channel_number = channel_number
         self._name = name
         self._switch_number = switch_number
+        # sensor type -> minimal change that is reported to HA, exact change when missing
+        self._deadbands = dict(deadbands) if deadbands else {}
 
         self._current_temperature = None
         self._current_humidity = None
@@ -44,11 +97,13 @@ class Sensor(Device):
         self._power_factor = None
         self._energy = None
 
-        self.register_telegram_received_cb(self._telegram_received_cb)
-        self._call_read_current_status_of_sensor(run_from_init=True)
+        # only one of the numbers is set for a sensor, it selects channel-addressed telegrams
+        channel = next((number for number in (switch_number, universal_switch_number, channel_number) if number is not None), None)
+        self.register_telegram_received_cb(self._telegram_received_cb, SENSOR_OPERATE_CODES, channel)
+        self._initialize_state()
 
     def _telegram_received_cb(self, telegram):
-        if telegram.operate_code in [OperateCode.Read12in1SensorStatusResponse,OperateCode.Broadcast12in1SensorStatusAutoResponse]:
+        if telegram.operate_code in TWELVE_IN_ONE_OPERATE_CODES:
             success_or_fail = telegram.payload[0]
             if success_or_fail == SuccessOrFailure.Success:
                 self._current_temperature = telegram.payload[1] - 20
@@ -59,9 +114,11 @@ class Sensor(Device):
                 self._dry_contact_2_status = telegram.payload[7]
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"12in1 sensor data received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")
-                self._call_device_updated()
+                self._notify_if_changed(
+                    SensorType.TEMPERATURE, SensorType.ILLUMINANCE, SensorType.MOTION, SensorType.SONIC, SensorType.DRY_CONTACT_1, SensorType.DRY_CONTACT_2
+                )
             else:
-                _LOGGER.error(f"12in1 sensor data failed to receive - {telegram.payload}")
+                _LOGGER.error(f"12in1 sensor data failed to receive - {list(telegram.payload)}")
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 msg_type = "broadcast" if telegram.operate_code == OperateCode.Broadcast12in1SensorStatusAutoResponse else "data"
                 _LOGGER.debug(f"12in1 sensor {msg_type} received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")
@@ -78,7 +135,7 @@ class Sensor(Device):
         #     _LOGGER.debug(f"12in1 broadcast data received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")       
         #     self._call_device_updated()
 
-        elif telegram.operate_code in [OperateCode.ReadSensorsInOneStatusResponse,OperateCode.BroadcastSensorsInOneStatusResponse]:
+        elif telegram.operate_code in SENSORS_IN_ONE_OPERATE_CODES:
             self._current_temperature = telegram.payload[1] - 20
             self._brightness = (telegram.payload[2] * 256) + telegram.payload[3]
             self._current_humidity = telegram.payload[4]
@@ -88,15 +145,17 @@ class Sensor(Device):
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastSensorsInOneStatusResponse else "data"
                 _LOGGER.debug(f"Sensors-in-one {msg_type} received - temp:{self._current_temperature}, brightness:{self._brightness}, humidity:{self._current_humidity}, motion:{self._motion_sensor}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")        
-            self._call_device_updated()
+            self._notify_if_changed(
+                SensorType.TEMPERATURE, SensorType.ILLUMINANCE, SensorType.HUMIDITY, SensorType.MOTION, SensorType.DRY_CONTACT_1, SensorType.DRY_CONTACT_2
+            )
 
         elif telegram.operate_code == OperateCode.DLPReadFloorHeatingStatusResponse:
             self._current_temperature = telegram.payload[1]
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Floor heating temperature received - temp:{self._current_temperature}")        
-            self._call_device_updated()
+            self._notify_if_changed(SensorType.TEMPERATURE)
 
-        elif telegram.operate_code in [OperateCode.BroadcastTemperatureResponse, OperateCode.ReadTemperatureStatusResponse]:
+        elif telegram.operate_code in TEMPERATURE_OPERATE_CODES:
             if self._channel_number is not None and self._channel_number == telegram.payload[0]:
                 self._current_temperature = telegram.payload[1]
                 
@@ -115,31 +174,31 @@ class Sensor(Device):
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastTemperatureResponse else "data"
                     _LOGGER.debug(f"Temperature {msg_type} received - temp: {self._current_temperature}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.TEMPERATURE)
 
-        elif telegram.operate_code in [OperateCode.ReadStatusOfUniversalSwitchResponse, OperateCode.UniversalSwitchControlResponse]:
+        elif telegram.operate_code in UNIVERSAL_SWITCH_OPERATE_CODES:
             switch_number = telegram.payload[0]
             status_enum = SwitchStatusOnOff(telegram.payload[1])
             if switch_number == self._universal_switch_number:
                 self._universal_switch_status = status_enum
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Universal switch status updated for switch {switch_number} - status:{status_enum}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.UNIVERSAL_SWITCH)
 
         elif telegram.operate_code == OperateCode.BroadcastStatusOfUniversalSwitch:
             if self._universal_switch_number is not None and self._universal_switch_number <= telegram.payload[0]:
                 self._universal_switch_status = SwitchStatusOnOff(telegram.payload[self._universal_switch_number])                
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Universal switch broadcast received for switch {self._universal_switch_number} - status:{self._universal_switch_status}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.UNIVERSAL_SWITCH)
 
-        elif telegram.operate_code in [OperateCode.ReadDryContactStatusResponse, OperateCode.ReadDryContactBroadcastStatusResponse]:
+        elif telegram.operate_code in DRY_CONTACT_OPERATE_CODES:
             if self._switch_number == telegram.payload[1]:
                 self._switch_status = telegram.payload[2]
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     msg_type = "broadcast" if telegram.operate_code == OperateCode.ReadDryContactBroadcastStatusResponse else "data"
                     _LOGGER.debug(f"Dry contact {msg_type} received for switch {self._switch_number} - status:{self._switch_status}")            
-                self._call_device_updated()            
+                self._notify_if_changed(SensorType.DRY_CONTACT)
         
         elif telegram.operate_code == OperateCode.ReadVoltageResponse:
             if self._channel_number is not None and 1 <= self._channel_number <= 3:
@@ -147,7 +206,7 @@ class Sensor(Device):
                 self._voltage = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Voltage received for device {self._device_address} channel {self._channel_number} - voltage:{self._voltage}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.VOLTAGE)
 
         elif telegram.operate_code == OperateCode.ReadCurrentResponse:
             if self._channel_number is not None and 1 <= self._channel_number <= 3:
@@ -155,7 +214,7 @@ class Sensor(Device):
                 self._current = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Current received for device {self._device_address} channel {self._channel_number} - current:{self._current}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.CURRENT)
 
         elif telegram.operate_code == OperateCode.ReadPowerStatusResponse:
             if self._channel_number is not None and 1 <= self._channel_number <= 4:  # Kanály 1-3 jsou fáze, 4 je total                
@@ -178,7 +237,9 @@ class Sensor(Device):
                                  f" active:{self._active_power}W,"
                                  f" reactive:{self._reactive_power}VAr,"
                                  f" apparent:{self._apparent_power}VA")
-                self._call_device_updated()
+                self._notify_if_changed(
+                    SensorType.ACTIVE_POWER, SensorType.REACTIVE_POWER, SensorType.APPARENT_POWER
+                )
 
         elif telegram.operate_code == OperateCode.ReadPowerFactorStatusResponse:
             if self._channel_number is not None and 1 <= self._channel_number <= 3:
@@ -186,7 +247,7 @@ class Sensor(Device):
                 self._power_factor = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Power factor received for device {self._device_address} channel {self._channel_number} - power factor:{self._power_factor }")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.POWER_FACTOR)
 
         elif telegram.operate_code == OperateCode.ReadElectricityStatusResponse:
             if self._channel_number is not None and 1 <= self._channel_number <= 4:
@@ -194,81 +255,72 @@ class Sensor(Device):
                 self._energy = (telegram.payload[offset] * 256) + telegram.payload[offset + 1]
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Energy received for device {self._device_address} channel {self._channel_number} - energy:{self._energy}")
-                self._call_device_updated()
+                self._notify_if_changed(SensorType.ENERGY)
 
 
-    async def read_sensor_status(self):
+    @property
+    def snapshot_key(self):
+        sensor_type = self._sensor_type.value if self._sensor_type is not None else None
+        selector = next((number for number in (self._switch_number, self._universal_switch_number, self._channel_number) if number is not None), None)
+        return f"sensor.{sensor_type}.{selector}"
+
+    def snapshot_state(self):
+        state = {}
+        for sensor_type, attribute in SENSOR_TYPE_ATTRIBUTES.items():
+            value = getattr(self, attribute)
+            if value is not None:
+                state[sensor_type.value] = value.value if isinstance(value, SwitchStatusOnOff) else value
+        return state
+
+    def restore_snapshot(self, state):
+        for sensor_type, attribute in SENSOR_TYPE_ATTRIBUTES.items():
+            value = state.get(sensor_type.value)
+            if value is None:
+                continue
+            if sensor_type == SensorType.UNIVERSAL_SWITCH:
+                value = SwitchStatusOnOff(value)
+            setattr(self, attribute, value)
+
+    def _notify_if_changed(self, *sensor_types):
+        """Call device updated only if a value moved by more than its deadband."""
+        values = {sensor_type: getattr(self, SENSOR_TYPE_ATTRIBUTES[sensor_type]) for sensor_type in sensor_types}
+        if self._values_changed(values, self._deadbands):
+            self._call_device_updated()
+
+    def _read_status_control(self):
         if self._device_family is not None and self._device_family == DeviceFamily.DLP:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading DLP floor heating status for device {self._device_address}")
-            rfhs = _ReadFloorHeatingStatus(self._hass, self._device_address)            
-            await rfhs.send()
+            return _ReadFloorHeatingStatus(self._hass, self._device_address)
         elif self._device_family is not None and self._device_family == DeviceFamily.SENSORS_IN_ONE:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading sensors-in-one status for device {self._device_address}")
-            rsios = _ReadSensorsInOneStatus(self._hass, self._device_address)            
-            await rsios.send()
+            return _ReadSensorsInOneStatus(self._hass, self._device_address)
         elif self._device_family is not None and self._device_family == DeviceFamily.TWELVE_IN_ONE:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading 12-in-1 sensor status for device {self._device_address}")
-            rsios = _Read12in1SensorStatus(self._hass, self._device_address)
-            await rsios.send()            
+            return _Read12in1SensorStatus(self._hass, self._device_address)
         elif self._sensor_type is not None and self._sensor_type == SensorType.DRY_CONTACT:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading dry contact status for device {self._device_address}, switch {self._switch_number}")
-            rdcs = _ReadDryContactStatus(self._hass, self._device_address)            
+            rdcs = _ReadDryContactStatus(self._hass, self._device_address)
             rdcs.switch_number = self._switch_number
-            await rdcs.send()
+            return rdcs
         elif self._universal_switch_number is not None:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading universal switch status for device {self._device_address}, switch {self._universal_switch_number}")
-            rsous = _ReadStatusOfUniversalSwitch(self._hass, self._device_address)            
+            rsous = _ReadStatusOfUniversalSwitch(self._hass, self._device_address)
             rsous.switch_number = self._universal_switch_number
-            await rsous.send()
+            return rsous
         elif self._sensor_type is not None and self._sensor_type == SensorType.TEMPERATURE:
-            channel = self._channel_number if self._channel_number is not None else 1
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading temperature status for device {self._device_address}, channel {channel}")
-            rts = _ReadTemperatureStatus(self._hass, self._device_address)            
-            rts.channel_number = channel
-            await rts.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.VOLTAGE and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadVoltageStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.CURRENT and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading current status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadCurrentStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.ACTIVE_POWER and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadPowerStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.POWER_FACTOR and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rpfs = _ReadPowerFactorStatus(self._hass, self._device_address)                        
-            rpfs.channel_number = self._channel_number
-            await rpfs.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.ENERGY and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            res = _ReadElectricityStatus(self._hass, self._device_address)                        
-            res.channel_number = self._channel_number
-            await res.send()
-
-
+            rts = _ReadTemperatureStatus(self._hass, self._device_address)
+            rts.channel_number = self._channel_number if self._channel_number is not None else 1
+            return rts
+        elif self._sensor_type is not None and self._sensor_type in SENSOR_TYPE_READ_CONTROLS and self._channel_number is not None:
+            control = SENSOR_TYPE_READ_CONTROLS[self._sensor_type](self._hass, self._device_address)
+            control.channel_number = self._channel_number
+            return control
         elif self._sensor_type is not None and self._channel_number is not None:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading channel status for device {self._device_address}")
-            rsoc = _ReadStatusOfChannels(self._hass, self._device_address)            
-            await rsoc.send()
+            return _ReadStatusOfChannels(self._hass, self._device_address)
+        return None
+
+    async def read_sensor_status(self):
+        control = self._read_status_control()
+        if control is None:
+            return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Reading {type(control).__name__[1:]} for device {self._device_address}")
+        await control.send()
 
 
     @property
@@ -325,13 +377,3 @@ class Sensor(Device):
             return True
         else:
             return False
-
-
-    def _call_read_current_status_of_sensor(self, run_from_init=False):
-
-        async def read_current_status_of_sensor():
-            if run_from_init:
-                await asyncio.sleep(5)
-            await self.read_sensor_status()
-
-        asyncio.ensure_future(read_current_status_of_sensor(), loop=self._hass.loop)
@@ -3,6 +3,12 @@ from .device import Device
 from ..helpers.enums import *
 from ..helpers.generics import Generics
 
+SWITCH_OPERATE_CODES = (
+    OperateCode.SingleChannelControlResponse,
+    OperateCode.ReadStatusOfChannelsResponse,
+    OperateCode.SceneControlResponse,
+)
+
 
 class Switch(Device):
     def __init__(self, hass, device_address, channel_number, name="", delay_read_current_state_seconds=0):
@@ -13,8 +19,8 @@ class Switch(Device):
         self._device_address = device_address
         self._channel_number = channel_number
         self._brightness = 0
-        self.register_telegram_received_cb(self._telegram_received_cb)
-        self._call_read_current_status_of_channels(run_from_init=True)
+        self.register_telegram_received_cb(self._telegram_received_cb, SWITCH_OPERATE_CODES, channel_number)
+        self._initialize_state()
 
     def _telegram_received_cb(self, telegram):
         if telegram.operate_code == OperateCode.SingleChannelControlResponse:
@@ -23,11 +29,13 @@ class Switch(Device):
             brightness = telegram.payload[2]
             if channel == self._channel_number:
                 self._brightness = brightness
-                self._call_device_updated()
+                if self._values_changed({"brightness": brightness}):
+                    self._call_device_updated()
         elif telegram.operate_code == OperateCode.ReadStatusOfChannelsResponse:
             if self._channel_number <= telegram.payload[0]:
                 self._brightness = telegram.payload[self._channel_number]
-                self._call_device_updated()
+                if self._values_changed({"brightness": self._brightness}):
+                    self._call_device_updated()
         elif telegram.operate_code == OperateCode.SceneControlResponse:
             self._call_read_current_status_of_channels()
 
@@ -39,8 +47,11 @@ class Switch(Device):
         intensity = 0
         await self._set(intensity, 0)
 
+    def _read_status_control(self):
+        return _ReadStatusOfSwitch(self._hass, self._device_address)
+
     async def read_status(self):
-        rsos = _ReadStatusOfSwitch(self._hass, self._device_address)        
+        rsos = self._read_status_control()
         await rsos.send()
 
     @property
@@ -54,8 +65,19 @@ class Switch(Device):
         else:
             return True
 
+    @property
+    def snapshot_key(self):
+        return f"switch.{self._channel_number}"
+
+    def snapshot_state(self):
+        return {"brightness": self._brightness}
+
+    def restore_snapshot(self, state):
+        self._brightness = int(state["brightness"])
+
     async def _set(self, intensity, running_time_seconds):
         self._brightness = intensity
+        self._forget_reported_values()
 
         generics = Generics()
         (minutes, seconds) = generics.calculate_minutes_seconds(running_time_seconds)
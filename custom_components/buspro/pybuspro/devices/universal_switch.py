@@ -4,6 +4,12 @@ from .control import _UniversalSwitch, _ReadStatusOfUniversalSwitch
 from .device import Device
 from ..helpers.enums import *
 
+SWITCH_STATUS_OPERATE_CODES = frozenset((
+    OperateCode.UniversalSwitchControlResponse,
+    OperateCode.ReadStatusOfUniversalSwitchResponse,
+))
+UNIVERSAL_SWITCH_OPERATE_CODES = SWITCH_STATUS_OPERATE_CODES | {OperateCode.BroadcastStatusOfUniversalSwitch}
+
 
 class UniversalSwitch(Device):
     def __init__(self, hass, device_address, switch_number, name="", delay_read_current_state_seconds=0):
@@ -14,18 +20,20 @@ class UniversalSwitch(Device):
         self._device_address = device_address
         self._switch_number = switch_number
         self._switch_status = SwitchStatusOnOff.OFF
-        self.register_telegram_received_cb(self._telegram_received_cb)
-        self._call_read_current_status_of_universal_switch(run_from_init=True)
+        self.register_telegram_received_cb(self._telegram_received_cb, UNIVERSAL_SWITCH_OPERATE_CODES, switch_number)
+        self._initialize_state()
 
     def _telegram_received_cb(self, telegram):
-        if telegram.operate_code in [OperateCode.UniversalSwitchControlResponse, OperateCode.ReadStatusOfUniversalSwitchResponse]:
+        if telegram.operate_code in SWITCH_STATUS_OPERATE_CODES:
             if self._switch_number <= telegram.payload[0]:
                 self._switch_status = SwitchStatusOnOff(telegram.payload[1])
-                self._call_device_updated()
+                if self._values_changed({"switch_status": self._switch_status}):
+                    self._call_device_updated()
         elif telegram.operate_code == OperateCode.BroadcastStatusOfUniversalSwitch:
             if self._switch_number <= telegram.payload[0]:
                 self._switch_status = SwitchStatusOnOff(telegram.payload[self._switch_number])
-                self._call_device_updated(should_reschedule=False)  # Broadcast updates shouldn't reset scheduler
+                if self._values_changed({"switch_status": self._switch_status}):
+                    self._call_device_updated(should_reschedule=False)  # Broadcast updates shouldn't reset scheduler
 
     async def set_on(self):
         await self._set(OnOff.ON)
@@ -33,9 +41,13 @@ class UniversalSwitch(Device):
     async def set_off(self):
         await self._set(OnOff.OFF)
 
-    async def read_status(self):
+    def _read_status_control(self):
         rsous = _ReadStatusOfUniversalSwitch(self._hass, self._device_address)
         rsous.switch_number = self._switch_number
+        return rsous
+
+    async def read_status(self):
+        rsous = self._read_status_control()
         await rsous.send()
 
     @property
@@ -49,22 +61,21 @@ class UniversalSwitch(Device):
     def device_identifier(self):
         return f"{self._device_address}-{self._switch_number}"
 
+    @property
+    def snapshot_key(self):
+        return f"universal_switch.{self._switch_number}"
+
+    def snapshot_state(self):
+        return {"switch_status": 0 if self._switch_status in (SwitchStatusOnOff.OFF, OnOff.OFF) else 1}
+
+    def restore_snapshot(self, state):
+        self._switch_status = SwitchStatusOnOff(state["switch_status"])
+
     async def _set(self, switch_status):
         self._switch_status = switch_status
+        self._forget_reported_values()
 
         us = _UniversalSwitch(self._hass, self._device_address)        
         us.switch_number = self._switch_number
         us.switch_status = self._switch_status
         await us.send()
-
-    def _call_read_current_status_of_universal_switch(self, run_from_init=False):
-
-        async def read_current_state_of_universal_switch():
-            if run_from_init:
-                await asyncio.sleep(1)
-
-            read_status_of_universal_switch = _ReadStatusOfUniversalSwitch(self._hass, self._device_address)            
-            read_status_of_universal_switch.switch_number = self._switch_number
-            await read_status_of_universal_switch.send()
-
-        asyncio.ensure_future(read_current_state_of_universal_switch(), loop=self._hass.loop)
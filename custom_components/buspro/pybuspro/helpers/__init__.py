@@ -1,3 +1,4 @@
 from .enums import *
+from .decode_index import DecodeIndex, decode_index
 from .generics import Generics
 from .telegram_helper import TelegramHelper
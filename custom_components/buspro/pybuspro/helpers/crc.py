@@ -0,0 +1,90 @@
+"""CRC-CCITT (XModem: poly 0x1021, init 0, no reflection) used by HDL telegrams."""
+import binascii
+import logging
+import timeit
+
+try:
+    import crcmod
+except ImportError:  # crcmod is optional, built-in backends cover it
+    crcmod = None
+
+_LOGGER = logging.getLogger(__name__)
+
+CRC_BACKEND_BINASCII = "binascii"
+CRC_BACKEND_TABLE = "table"
+CRC_BACKEND_CRCMOD = "crcmod"
+DEFAULT_CRC_BACKEND = CRC_BACKEND_BINASCII
+
+
+def _build_table():
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+
+CRC16_TABLE = _build_table()
+
+
+def crc16_table(data) -> int:
+    """Table-driven pure Python CRC; accepts bytes, bytearray or memoryview."""
+    crc = 0
+    table = CRC16_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+
+def crc16_binascii(data) -> int:
+    """Stdlib C implementation, works on any buffer without copying it."""
+    return binascii.crc_hqx(data, 0)
+
+
+def _crc16_crcmod():
+    if crcmod is None:
+        return None
+    crc16func = crcmod.mkCrcFun(0x11021, initCrc=0, rev=False, xorOut=0)
+
+    def crc16_crcmod(data) -> int:
+        # crcmod does not accept memoryview
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return crc16func(data)
+
+    return crc16_crcmod
+
+
+def available_crc_backends() -> dict:
+    """Return available backends as name -> function."""
+    backends = {
+        CRC_BACKEND_BINASCII: crc16_binascii,
+        CRC_BACKEND_TABLE: crc16_table,
+    }
+    crcmod_func = _crc16_crcmod()
+    if crcmod_func is not None:
+        backends[CRC_BACKEND_CRCMOD] = crcmod_func
+    return backends
+
+
+def get_crc_function(backend: str = DEFAULT_CRC_BACKEND):
+    """Return CRC function for backend name, falling back to the default one."""
+    backends = available_crc_backends()
+    if backend not in backends:
+        _LOGGER.warning(f"CRC backend '{backend}' is not available, using '{DEFAULT_CRC_BACKEND}'")
+        backend = DEFAULT_CRC_BACKEND
+    return backends[backend]
+
+
+def benchmark_crc_backends(data=None, number: int = 10000) -> dict:
+    """Measure each available backend; returns name -> microseconds per call."""
+    if data is None:
+        # typical 12in1 status frame without the CRC
+        data = memoryview(bytes(range(16, 16 + 22)))
+    results = {}
+    for name, func in available_crc_backends().items():
+        seconds = timeit.timeit(lambda: func(data), number=number)
+        results[name] = seconds / number * 1_000_000
+    return results
@@ -0,0 +1,66 @@
+import logging
+from collections import Counter
+
+from .enums import DeviceType, OperateCode
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DecodeIndex:
+    """Precomputed lookup tables for the operate code and device type fields.
+
+    Both fields are two bytes on the wire, so the tables are keyed by the
+    16-bit big-endian integer of those bytes. Enum aliases (members sharing a
+    value) resolve to the canonical member, same as ``OperateCode(value)``.
+    """
+
+    def __init__(self):
+        self.operate_codes = self._build_table(OperateCode)
+        self.device_types = self._build_table(DeviceType)
+        self._by_value = {
+            OperateCode: {member.value: member for member in OperateCode},
+            DeviceType: {member.value: member for member in DeviceType},
+        }
+        self.unknown_operate_codes = Counter()
+        self.unknown_device_types = Counter()
+
+    @staticmethod
+    def _build_table(enum):
+        table = {}
+        for member in enum:
+            if len(member.value) == 2:
+                table[int.from_bytes(member.value, "big")] = member
+        return table
+
+    def operate_code(self, code: int):
+        """Return OperateCode for 16-bit code or None (counted as unknown)."""
+        operate_code = self.operate_codes.get(code)
+        if operate_code is None:
+            self._count_unknown(self.unknown_operate_codes, "operate code", code)
+        return operate_code
+
+    def device_type(self, code: int):
+        """Return DeviceType for 16-bit code or None (counted as unknown)."""
+        device_type = self.device_types.get(code)
+        if device_type is None:
+            self._count_unknown(self.unknown_device_types, "device type", code)
+        return device_type
+
+    def lookup(self, enum, value):
+        """Return member of OperateCode/DeviceType for raw bytes value or None."""
+        if len(value) == 2:
+            code = (value[0] << 8) | value[1]
+            if enum is OperateCode:
+                return self.operate_code(code)
+            if enum is DeviceType:
+                return self.device_type(code)
+        return self._by_value[enum].get(bytes(value))
+
+    @staticmethod
+    def _count_unknown(counter, kind, code):
+        counter[code] += 1
+        if counter[code] == 1 and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Unknown {kind} 0x{code:04x} received")
+
+
+decode_index = DecodeIndex()
@@ -1,5 +1,4 @@
 from enum import Enum, IntEnum
-import voluptuous as vol
 
 class OperateCode(Enum):
     NotSet = b'\x00'
@@ -219,6 +218,14 @@ class SensorType(Enum):
     ENERGY = "energy"
     
 
+class TransmitPriority(IntEnum):
+    """Transmit queue class, lower value is sent first."""
+    USER = 0            # commands issued by the user
+    CONFIRMATION = 1    # reads confirming the result of a command or scene
+    POLL = 2            # periodic status reads
+    BACKGROUND = 3      # warm-up reads, time broadcast
+
+
 class SwitchType(str, Enum):
     """Switch type enum."""
     RELAY = "relay"  # Standard relay switch
@@ -231,5 +238,7 @@ def validate_device_family(value):
         return value
     valid_values = [member.value for member in DeviceFamily]
     if value not in valid_values:
+        # only config validation needs voluptuous, the library itself does not
+        import voluptuous as vol
         raise vol.Invalid(f"Invalid device family: {value}. Valid values are: {', '.join(valid_values)}")
     return value
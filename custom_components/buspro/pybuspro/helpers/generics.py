@@ -1,3 +1,4 @@
+from .decode_index import decode_index
 from .enums import DeviceType, OperateCode
 
 
@@ -24,13 +25,5 @@ class Generics:
         return any(value == item.value for item in enum)
 
     def get_enum_value(self, enum, value):
-        if enum == DeviceType:
-            if self.enum_has_value(enum, value):
-                return DeviceType(value)
-            else:
-                return None
-        elif enum == OperateCode:
-            if self.enum_has_value(enum, value):
-                return OperateCode(value)
-            else:
-                return None
+        if enum == DeviceType or enum == OperateCode:
+            return decode_index.lookup(enum, value)
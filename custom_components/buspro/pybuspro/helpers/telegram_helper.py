@@ -1,10 +1,10 @@
 import traceback
+from collections import Counter
 from struct import *
 
-import crcmod
-
+from .crc import DEFAULT_CRC_BACKEND, get_crc_function
+from .decode_index import decode_index
 from .enums import DeviceType
-from .generics import Generics
 from ..core.telegram import Telegram
 from ..devices.control import *
 _LOGGER = logging.getLogger(__name__)
@@ -20,56 +20,89 @@ class TelegramHelper:
     IDX_CONTENT = 25
     CONTENT_LENGTH_OFFSET = 11
     HDL_HEADER = b'\xC0\xA8\x01\x0FHDLMIRACLE\xAA\xAA'
+    IDX_MAGIC = 4
+    HDL_MAGIC = HDL_HEADER[IDX_MAGIC:]
+    MIN_DATAGRAM_LENGTH = IDX_LENGTH + CONTENT_LENGTH_OFFSET
+
+    REJECT_TOO_SHORT = "too_short"
+    REJECT_BAD_MAGIC = "bad_magic"
+    REJECT_BAD_LENGTH = "bad_length"
+    REJECT_CRC = "crc"
+    REJECT_DECODE_ERROR = "decode_error"
     
-    def __init__(self):
+    def __init__(self, crc_backend=DEFAULT_CRC_BACKEND):
         """Initialize the telegram helper."""
-        self.crc16func = crcmod.mkCrcFun(0x11021, initCrc=0, rev=False, xorOut=0)
-
-    def build_telegram_from_udp_data(self, data, address):
-        """Build telegram from UDP data."""
+        self.crc16func = get_crc_function(crc_backend)
+        self.filtered_count = 0
+        self.quarantine = Counter()
+
+    def set_crc_backend(self, crc_backend):
+        """Switch CRC implementation at runtime (binascii, table, crcmod)."""
+        self.crc16func = get_crc_function(crc_backend)
+
+    def _validate_udp_data(self, data):
+        """Return reject reason for non-HDL or malformed datagram, None if valid."""
+        length = len(data)
+        if length < self.MIN_DATAGRAM_LENGTH:
+            return self.REJECT_TOO_SHORT
+        if not data.startswith(self.HDL_MAGIC, self.IDX_MAGIC):
+            return self.REJECT_BAD_MAGIC
+        if data[self.IDX_LENGTH] + self.IDX_LENGTH != length:
+            return self.REJECT_BAD_LENGTH
+        return None
+
+    def _reject(self, reason, data):
+        self.quarantine[reason] += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Datagram rejected ({reason}): {bytes(data).hex()}")
+
+    def build_telegram_from_udp_data(self, data, address, source_filter=None):
+        """Build telegram from UDP data.
+
+        When source_filter is given, only the source address is parsed first and
+        None is returned for telegrams the filter rejects. Payload is materialised
+        lazily on first access.
+        """
         if not data:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("build_telegram_from_udp_data: no data")
             return None
 
+        reject_reason = self._validate_udp_data(data)
+        if reject_reason is not None:
+            self._reject(reject_reason, data)
+            return None
+
         try:
-            # Get length and calculate content length
-            length_of_data_package = data[self.IDX_LENGTH]
-            content_length = length_of_data_package - self.CONTENT_LENGTH_OFFSET
-            
+            source_key = (data[self.IDX_SRC_SUBNET] << 8) | data[self.IDX_SRC_DEVICE]
+            if source_filter is not None and not source_filter(source_key):
+                self.filtered_count += 1
+                return None
+
             # Extract device info and addresses
-            source_subnet_id = data[self.IDX_SRC_SUBNET]
-            source_device_id = data[self.IDX_SRC_DEVICE]
-            source_device_type_hex = data[self.IDX_DEV_TYPE:self.IDX_DEV_TYPE + 2]
-            operate_code_hex = data[self.IDX_OP_CODE:self.IDX_OP_CODE + 2]
-            target_subnet_id = data[self.IDX_TGT_SUBNET]
-            target_device_id = data[self.IDX_TGT_DEVICE]
-            
-            # Extract content and CRC
-            content = data[self.IDX_CONTENT:self.IDX_CONTENT + content_length]
-            crc = data[-2:]
-
-            # Create and populate telegram
-            generics = Generics()
+            source_device_type = (data[self.IDX_DEV_TYPE] << 8) | data[self.IDX_DEV_TYPE + 1]
+            operate_code = (data[self.IDX_OP_CODE] << 8) | data[self.IDX_OP_CODE + 1]
+
+            # Create and populate telegram, payload view is created on first access
             telegram = Telegram()
-            telegram.source_device_type = generics.get_enum_value(DeviceType, source_device_type_hex)
+            telegram.source_device_type = decode_index.device_type(source_device_type)
             telegram.udp_data = data
-            telegram.source_address = (source_subnet_id, source_device_id)
-            telegram.operate_code = generics.get_enum_value(OperateCode, operate_code_hex)
-            telegram.target_address = (target_subnet_id, target_device_id)
+            telegram.source_key = source_key
+            telegram.operate_code = decode_index.operate_code(operate_code)
+            telegram.target_key = (data[self.IDX_TGT_SUBNET] << 8) | data[self.IDX_TGT_DEVICE]
             telegram.udp_address = address
-            telegram.payload = generics.hex_to_integer_list(content)
-            telegram.crc = crc
 
             # Validate CRC
             if not self._check_crc(telegram):
-                _LOGGER.error("CRC check failed")
+                self._reject(self.REJECT_CRC, data)
                 return None
 
             return telegram
-            
-        except Exception as e:
-            _LOGGER.error(f"Error building telegram: {traceback.format_exc()}")
+
+        except Exception:
+            self.quarantine[self.REJECT_DECODE_ERROR] += 1
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Error building telegram: {traceback.format_exc()}")
             return None
 
     def build_send_buffer(self, telegram: Telegram):
@@ -92,9 +125,9 @@ class TelegramHelper:
         send_buf[16] = length_of_data_package        
         
         # Process source address
-        if telegram.source_address is not None:
-            send_buf[17] = telegram.source_address[0]  # sender_subnet_id
-            send_buf[18] = telegram.source_address[1]  # sender_device_id
+        if telegram.source_key is not None:
+            send_buf[17] = telegram.source_key >> 8  # sender_subnet_id
+            send_buf[18] = telegram.source_key & 0xFF  # sender_device_id
         else:
             send_buf[17] = 254
             send_buf[18] = 253        
@@ -111,35 +144,27 @@ class TelegramHelper:
         send_buf[21:23] = bytes(operate_code_hex)
         
         # Insert target address
-        target_subnet_id, target_device_id = telegram.target_address
-        send_buf[23] = target_subnet_id
-        send_buf[24] = target_device_id        
+        send_buf[23] = telegram.target_key >> 8
+        send_buf[24] = telegram.target_key & 0xFF
         
         # Insert payload in single operation
         if payload:
             send_buf[25:25+len(payload)] = bytes(payload)        
         
         # Calculate and add CRC
-        crc = self.crc16func(send_buf[16:16+length_of_data_package-2])
-        send_buf[25+len(payload):] = pack(">H", crc)
+        with memoryview(send_buf) as view:
+            crc = self.crc16func(view[16:16+length_of_data_package-2])
+        pack_into(">H", send_buf, 25+len(payload), crc)
         return send_buf
 
 
     def _calculate_crc_from_telegram(self, telegram):
-        length_of_data_package = 11 + len(telegram.payload)
-        crc_buf_length = length_of_data_package - 2
-        send_buf = telegram.udp_data[:-2]
-        crc_buf = send_buf[-crc_buf_length:]
-        crc_buf_as_bytes = bytes(crc_buf)
-        crc = self.crc16func(crc_buf_as_bytes)
-        
-        return pack(">H", crc)
+        crc_buf_length = telegram.udp_data[self.IDX_LENGTH] - 2
+        with memoryview(telegram.udp_data) as view:
+            crc = self.crc16func(view[-2 - crc_buf_length:-2])
+        return crc
 
-    def _check_crc(self, telegram):        
+    def _check_crc(self, telegram):
         calculated_crc = self._calculate_crc_from_telegram(telegram)
-        if calculated_crc == telegram.crc:
-            return True
-        return False
-
-
-
+        udp_data = telegram.udp_data
+        return calculated_crc == (udp_data[-2] << 8) | udp_data[-1]
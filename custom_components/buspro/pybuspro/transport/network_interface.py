@@ -3,26 +3,32 @@ import logging
 from custom_components.buspro.const import DATA_BUSPRO
 from .udp_client import UDPClient
 from ..helpers.telegram_helper import TelegramHelper
+from ..helpers.enums import TransmitPriority
+from .transmit_queue import TransmitQueue, DEFAULT_FRAME_RATE, DEFAULT_FRAME_GAP
 # from ..devices.control import Control
 import time
 #_LOGGER = logging.getLogger(__name__)
 
 class NetworkInterface:
-    def __init__(self, hass, gateway_address_send_receive):
+    def __init__(self, hass, gateway_address_send_receive, frame_rate=DEFAULT_FRAME_RATE, frame_gap=DEFAULT_FRAME_GAP):
         self._hass = hass
         self.gateway_address_send_receive = gateway_address_send_receive
         self.udp_client = None
         self.callback = None
+        self.telegram_filter = None
+        self.telegram_sent_callback = None
         self._init_udp_client()
         self._th = TelegramHelper()
+        self.transmit_queue = TransmitQueue(hass.loop, self._transmit, frame_rate, frame_gap)
 
     def _init_udp_client(self):
         self.udp_client = UDPClient(self._hass, self.gateway_address_send_receive, self._udp_request_received)
 
     def _udp_request_received(self, data, address):
         if self.callback is not None:
-            telegram = self._th.build_telegram_from_udp_data(data, address)
-            self.callback(telegram)
+            telegram = self._th.build_telegram_from_udp_data(data, address, self.telegram_filter)
+            if telegram is not None:
+                self.callback(telegram)
 
     """
     public methods
@@ -30,15 +36,29 @@ class NetworkInterface:
     def register_callback(self, callback):
         self.callback = callback
 
+    def register_telegram_filter(self, telegram_filter):
+        """Register predicate on packed source address, called before full decode."""
+        self.telegram_filter = telegram_filter
+
+    def register_telegram_sent_callback(self, telegram_sent_callback):
+        """Register callback called with every telegram handed to the gateway."""
+        self.telegram_sent_callback = telegram_sent_callback
+
     async def start(self):
         await self.udp_client.start()
+        self.transmit_queue.start()
 
     async def stop(self):
+        await self.transmit_queue.stop()
         if self.udp_client is not None:
             await self.udp_client.stop()
             self.udp_client = None
 
-    async def send_telegram(self, telegram):
+    async def send_telegram(self, telegram, priority=TransmitPriority.USER):
+        """Queue telegram for transmission, returns once it was handed to the gateway."""
+        await self.transmit_queue.send(telegram, priority)
+
+    async def _transmit(self, telegram):
         #start_time = time.perf_counter_ns()
         message = self._th.build_send_buffer(telegram)
         #end_time = time.perf_counter_ns()
@@ -46,6 +66,8 @@ class NetworkInterface:
         #_LOGGER.debug(f"Time to build send buffer: {duration} ns")
         gateway_address_send, _ = self.gateway_address_send_receive
         await self.udp_client.send_message(message)
+        if self.telegram_sent_callback is not None:
+            self.telegram_sent_callback(telegram)
 
         
         if self._hass.data[DATA_BUSPRO].hdl.logger.level == logging.DEBUG:
@@ -0,0 +1,134 @@
+import asyncio
+import heapq
+import itertools
+import logging
+
+from ..helpers.enums import TransmitPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+# 9600 baud RS485 carries ~30 frames of 30 bytes per second, leave room for the modules
+DEFAULT_FRAME_RATE = 20     # frames per second on average
+DEFAULT_FRAME_GAP = 0.02    # seconds, minimal gap between two frames
+FRAME_BURST = 5             # frames that may be sent back to back after idle time
+
+
+class TransmitClassStats:
+    __slots__ = ("depth", "max_depth", "sent", "wait_total", "wait_max")
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.sent = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @property
+    def wait_average(self):
+        return self.wait_total / self.sent if self.sent else 0.0
+
+
+class TransmitQueue:
+    """Priority queue in front of the gateway socket, paced to the bus speed.
+
+    Telegrams are sent in TransmitPriority order (FIFO within a class), at most
+    frame_rate frames per second (token bucket with a small burst) and never
+    closer than frame_gap. send() returns once the telegram left the socket.
+    """
+
+    def __init__(self, loop, transmit, frame_rate=DEFAULT_FRAME_RATE, frame_gap=DEFAULT_FRAME_GAP):
+        self._loop = loop
+        self._transmit = transmit          # async callable(telegram)
+        self.frame_rate = frame_rate
+        self.frame_gap = frame_gap
+        self._heap = []                    # (priority, sequence, telegram, future, enqueued_at)
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._last_sent = None
+        self._tokens = FRAME_BURST
+        self._tokens_time = loop.time()
+        self.stats = {priority: TransmitClassStats() for priority in TransmitPriority}
+
+    def start(self):
+        if self._task is None:
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        while self._heap:
+            priority, _, _, future, _ = heapq.heappop(self._heap)
+            self.stats[priority].depth -= 1
+            if not future.done():
+                future.cancel()
+
+    async def send(self, telegram, priority=TransmitPriority.USER):
+        """Queue telegram and wait until it is transmitted."""
+        future = self._loop.create_future()
+        heapq.heappush(self._heap, (priority, next(self._sequence), telegram, future, self._loop.time()))
+        stats = self.stats[priority]
+        stats.depth += 1
+        if stats.depth > stats.max_depth:
+            stats.max_depth = stats.depth
+        self._wakeup.set()
+        await future
+
+    def _pacing_delay(self, now):
+        self._tokens = min(FRAME_BURST, self._tokens + (now - self._tokens_time) * self.frame_rate)
+        self._tokens_time = now
+        delay = (1 - self._tokens) / self.frame_rate if self._tokens < 1 else 0.0
+        if self._last_sent is not None:
+            delay = max(delay, self._last_sent + self.frame_gap - now)
+        return delay
+
+    async def _run(self):
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            delay = self._pacing_delay(self._loop.time())
+            if delay > 0:
+                # pick again afterwards, a more urgent telegram may arrive meanwhile
+                await asyncio.sleep(delay)
+                continue
+
+            priority, _, telegram, future, enqueued_at = heapq.heappop(self._heap)
+            stats = self.stats[priority]
+            stats.depth -= 1
+            if future.done():   # sender gave up waiting
+                continue
+
+            now = self._loop.time()
+            self._tokens -= 1
+            self._last_sent = now
+            wait = now - enqueued_at
+            stats.sent += 1
+            stats.wait_total += wait
+            if wait > stats.wait_max:
+                stats.wait_max = wait
+
+            try:
+                await self._transmit(telegram)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(None)
+
+    def metrics(self):
+        """Return per class queue depth and wait time statistics."""
+        return {
+            priority.name.lower(): {
+                "depth": stats.depth,
+                "max_depth": stats.max_depth,
+                "sent": stats.sent,
+                "wait_average": stats.wait_average,
+                "wait_max": stats.wait_max,
+            }
+            for priority, stats in self.stats.items()
+        }
@@ -1,134 +1,431 @@
 """Scheduler for periodic reading of Buspro entities."""
-from dataclasses import dataclass
+from __future__ import annotations
+
 import asyncio
 import logging
-import heapq
-from datetime import timedelta
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.core import callback, HomeAssistant
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+from .const import DATA_BUSPRO
+from .pybuspro.core.telegram import address_key
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
-class EntityInfo:
-    """Entity information for scheduling."""
-    scan_interval: int
-    next_read_time: float
-    entity_id: str
+DEFAULT_READ_BUDGET = 10     # reads per second, RS485 at 9600 baud carries ~30 short frames/s
+MAX_IDLE_SLEEP = 60          # seconds, upper bound of one sleep when nothing is due
+
+class IndexedHeap:
+    """Binary min-heap of keys ordered by deadline.
+
+    A position index keyed by key allows changing the deadline of a queued key
+    (decrease-key and increase-key) and removing it in O(log n), so the heap
+    never holds stale entries.
+    """
+    def __init__(self):
+        self._heap = []     # [deadline, key]
+        self._index = {}    # key -> position in _heap
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def peek(self):
+        """Return (deadline, key) of the earliest entry or None."""
+        if not self._heap:
+            return None
+        deadline, key = self._heap[0]
+        return deadline, key
+
+    def deadline(self, key):
+        """Return deadline of key or None if it is not queued."""
+        position = self._index.get(key)
+        return self._heap[position][0] if position is not None else None
+
+    def push(self, key, deadline: float) -> None:
+        """Insert key or move it to a new deadline."""
+        position = self._index.get(key)
+        if position is None:
+            self._heap.append([deadline, key])
+            self._index[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+        entry = self._heap[position]
+        previous, entry[0] = entry[0], deadline
+        if deadline < previous:
+            self._sift_up(position)
+        elif deadline > previous:
+            self._sift_down(position)
+
+    def pop(self):
+        """Remove and return (deadline, key) of the earliest entry."""
+        deadline, key = self._heap[0]
+        self._remove_at(0)
+        return deadline, key
+
+    def remove(self, key) -> bool:
+        """Remove key, return False if it was not queued."""
+        position = self._index.get(key)
+        if position is None:
+            return False
+        self._remove_at(position)
+        return True
+
+    def _remove_at(self, position: int) -> None:
+        heap = self._heap
+        del self._index[heap[position][1]]
+        last = heap.pop()
+        if position == len(heap):
+            return
+        heap[position] = last
+        self._index[last[1]] = position
+        self._sift_up(position)
+        self._sift_down(self._index[last[1]])
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._index[heap[i][1]] = i
+        self._index[heap[j][1]] = j
+
+    def _sift_up(self, position: int) -> None:
+        heap = self._heap
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[position][0] >= heap[parent][0]:
+                break
+            self._swap(position, parent)
+            position = parent
+
+    def _sift_down(self, position: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        while True:
+            smallest = position
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size and heap[child][0] < heap[smallest][0]:
+                    smallest = child
+            if smallest == position:
+                break
+            self._swap(position, smallest)
+            position = smallest
+
 
-    def __lt__(self, other):
-        """Enable heap comparison."""
-        return self.next_read_time < other.next_read_time
+class PollGroup:
+    """Entities refreshed by the same status read of one module.
+
+    The key is the request key of the device status read (subnet, device,
+    operate code, payload), so six light channels of one dimmer share one
+    ReadStatusOfChannels. Entities whose device has no such key form a group
+    of their own keyed by entity_id.
+    """
+    def __init__(self, key):
+        self.key = key
+        self.members = {}   # entity_id -> scan interval, 0 = no own interval
+
+    @property
+    def scan_interval(self) -> int:
+        """Shortest requested interval of the members, 0 if none requested one."""
+        intervals = [seconds for seconds in self.members.values() if seconds > 0]
+        return min(intervals) if intervals else 0
 
 class Scheduler:
-    """Scheduler for periodic reading of entities."""
-    def __init__(self, hass: HomeAssistant):
+    """Deadline driven scheduler for periodic reading of entities.
+
+    The loop sleeps until the earliest deadline and then reads every entity
+    that is due, limited by a per-second read budget (token bucket). Entities
+    with scan interval are served first, entities without it use the remaining
+    budget. Reads that do not fit into the budget stay queued and are counted
+    as lag. Entities are scheduled per poll group, one read refreshes all
+    members of the group. Groups whose module recently broadcast the same
+    data are not read; their deadline moves to when the broadcast gets stale.
+    Groups of modules with an open circuit breaker wait for the next probe.
+    """
+    def __init__(self, hass: HomeAssistant, read_budget: float = DEFAULT_READ_BUDGET):
         self.hass = hass
-        self._periodic_heap = []     # heap for entities with scan interval
-        self._optional_heap = []    # heap for entities without scan interval
-        self.entities_map = {}       # map for quick entity access
+        self._periodic_heap = IndexedHeap()     # poll groups with scan interval
+        self._optional_heap = IndexedHeap()     # poll groups without scan interval
+        self.entities_map = {}       # entity_id -> PollGroup
+        self._groups = {}            # poll key -> PollGroup
+        self._updaters = {}          # entity_id -> entity.async_update
         self.default_read_interval = 10  # seconds
         self._now = self.hass.loop.time()
-        self._cancel_timer = None
+        self._task = None
+        self._wakeup = asyncio.Event()
+        self.read_budget = read_budget
+        self._tokens = float(read_budget)
+        self._tokens_time = self._now
+
+        # statistiky
+        self.read_count = 0
+        self.tick_count = 0
+        self.budget_exhausted_count = 0
+        self.suppressed_count = 0
+        self.backoff_count = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+
+    @property
+    def read_budget(self) -> float:
+        return self._read_budget
+
+    @read_budget.setter
+    def read_budget(self, value: float):
+        self._read_budget = float(value) if value and value > 0 else float(DEFAULT_READ_BUDGET)
+
+    @property
+    def average_lag(self) -> float:
+        """Average delay in seconds between deadline and actual read."""
+        return self._lag_total / self.read_count if self.read_count else 0.0
+
+    def lag_stats(self) -> dict:
+        """Return scheduling statistics."""
+        return {
+            "entities": len(self.entities_map),
+            "groups": len(self._groups),
+            "reads": self.read_count,
+            "ticks": self.tick_count,
+            "budget_exhausted": self.budget_exhausted_count,
+            "suppressed_by_broadcast": self.suppressed_count,
+            "suspended_by_backoff": self.backoff_count,
+            "last_lag": self.last_lag,
+            "average_lag": self.average_lag,
+            "max_lag": self.max_lag,
+            "read_budget": self.read_budget,
+        }
 
     async def add_entity(self, entity) -> None:
         """Add entity to scheduler.
-        
+
         Args:
             entity: Entity to schedule for periodic updates.
                     Must implement async_update method.
         """
         entity_id = entity.entity_id
-        
+
         if not hasattr(entity, 'async_update'):
             return
-        
+
         scan_interval = entity.scan_interval
-        
+
         if scan_interval is None or scan_interval == 0:
             seconds = 0
-            target_heap = self._optional_heap
         else:
             try:
                 seconds = int(scan_interval)
             except ValueError:
                 _LOGGER.error(f"Invalid scan_interval for entity {entity_id}: {scan_interval}")
                 seconds = self.default_read_interval
-            target_heap = self._periodic_heap
-
-        info = EntityInfo(
-            scan_interval=seconds,
-            next_read_time=self.hass.loop.time() + seconds,
-            entity_id=entity_id
-        )
-        self.entities_map[entity_id] = info
-        heapq.heappush(target_heap, info)
+
+        if entity_id in self.entities_map:
+            self._remove_entity(entity_id)
+
+        key = self._poll_key(entity)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = PollGroup(key)
+        previous_interval = group.scan_interval if group.members else None
+        group.members[entity_id] = seconds
+        self.entities_map[entity_id] = group
+        self._updaters[entity_id] = entity.async_update
+
+        if group.scan_interval != previous_interval:
+            next_read_time = self.hass.loop.time() + seconds
+            queued = self._deadline(group)
+            if queued is not None:
+                next_read_time = min(next_read_time, queued)
+            self._schedule_group(group, next_read_time)
+            # new deadline may be earlier than the one the loop sleeps for
+            self._wakeup.set()
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug(f"Added entity {entity_id} to scheduler (scan_interval={seconds}s)")
+            _LOGGER.debug(f"Added entity {entity_id} to scheduler (scan_interval={seconds}s, poll group of {len(group.members)})")
+
+    @staticmethod
+    def _poll_key(entity):
+        """Status read key of the entity's device, entity_id for devices without one."""
+        device = getattr(entity, "_device", None)
+        key = getattr(device, "read_status_key", None)
+        return key if key is not None else entity.entity_id
+
+    def _heap_for(self, group: PollGroup) -> IndexedHeap:
+        return self._periodic_heap if group.scan_interval > 0 else self._optional_heap
+
+    def _deadline(self, group: PollGroup):
+        """Queued next read time of group or None."""
+        deadline = self._periodic_heap.deadline(group.key)
+        return deadline if deadline is not None else self._optional_heap.deadline(group.key)
+
+    def _schedule_group(self, group: PollGroup, next_read_time: float) -> None:
+        """Set next read time of group, moving it between heaps if its interval kind changed."""
+        heap = self._heap_for(group)
+        other = self._optional_heap if heap is self._periodic_heap else self._periodic_heap
+        other.remove(group.key)
+        heap.push(group.key, next_read_time)
+
+    def _remove_entity(self, entity_id: str) -> None:
+        self._updaters.pop(entity_id, None)
+        group = self.entities_map.pop(entity_id, None)
+        if group is None:
+            return
+        previous_interval = group.scan_interval
+        group.members.pop(entity_id, None)
+        if not group.members:
+            del self._groups[group.key]
+            self._periodic_heap.remove(group.key)
+            self._optional_heap.remove(group.key)
+        elif group.scan_interval != previous_interval:
+            self._schedule_group(group, self._deadline(group))
 
     async def read_entities_periodically(self) -> None:
-        """Register periodic reading of entities."""
-        @callback
-        async def _process_entities(*_):
-            self._now = self.hass.loop.time()
-            
-            # Process one entity with interval if available and due
-            if self._periodic_heap and self._periodic_heap[0].next_read_time <= self._now:
-                info = heapq.heappop(self._periodic_heap)
-                await self.process_entity_reading(info.entity_id, info, info.scan_interval)
-                # Reschedule
-                info.next_read_time = self._now + info.scan_interval
-                heapq.heappush(self._periodic_heap, info)
-            # Process one immediate entity if no interval entity was processed
-            elif self._optional_heap and self._optional_heap[0].next_read_time <= self._now:
-                info = heapq.heappop(self._optional_heap)
-                await self.process_entity_reading(info.entity_id, info, self.default_read_interval)
-                # Reschedule
-                info.next_read_time = self._now + self.default_read_interval
-                heapq.heappush(self._optional_heap, info)
-
-        self._cancel_timer = async_track_time_interval(
-            self.hass,
-            _process_entities,
-            timedelta(seconds=1)
-        )
+        """Start the scheduling loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = self.hass.loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            delay = self._next_delay()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._process_due_entities()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.error(f"Error in scheduler loop: {e}")
+                await asyncio.sleep(1)
+
+    def _hdl(self):
+        return getattr(self.hass.data.get(DATA_BUSPRO), "hdl", None)
+
+    def _broadcast_fresh_until(self, key, interval: float):
+        """Time until which broadcasts of the module make the read unnecessary, or None."""
+        hdl = self._hdl()
+        if hdl is None:
+            return None
+        return hdl.broadcast_freshness.fresh_until(key, interval)
+
+    def _module_blocked_until(self, key, interval: float):
+        """Time of the next allowed read while the module circuit breaker is open, or None."""
+        hdl = self._hdl()
+        if hdl is None or not isinstance(key, tuple):
+            return None
+        module_key = address_key(key)
+        if hdl.module_health.allow_request(module_key):
+            return None
+        retry_at = hdl.module_health.retry_at(module_key)
+        return retry_at if retry_at is not None else self.hass.loop.time() + interval
+
+    def _refill_tokens(self, now: float) -> None:
+        self._tokens = min(self.read_budget, self._tokens + (now - self._tokens_time) * self.read_budget)
+        self._tokens_time = now
+
+    def _next_delay(self) -> float:
+        """Seconds until the next entity is due and a read token is available."""
+        now = self.hass.loop.time()
+        deadlines = [heap.peek()[0] for heap in (self._periodic_heap, self._optional_heap) if heap]
+        if not deadlines:
+            return MAX_IDLE_SLEEP
+        delay = min(deadlines) - now
+        self._refill_tokens(now)
+        if self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self.read_budget)
+        return min(delay, MAX_IDLE_SLEEP)
+
+    async def _process_due_entities(self) -> None:
+        self._now = now = self.hass.loop.time()
+        self._refill_tokens(now)
+        self.tick_count += 1
+        processed = 0
+
+        for heap in (self._periodic_heap, self._optional_heap):
+            while self._tokens >= 1 and heap and heap.peek()[0] <= now:
+                deadline, key = heap.peek()
+                group = self._groups[key]
+                interval = group.scan_interval if group.scan_interval > 0 else self.default_read_interval
+
+                fresh_until = self._broadcast_fresh_until(key, interval)
+                if fresh_until is not None:
+                    # broadcast data is fresher than the interval, read only if broadcasts stop
+                    heap.push(key, fresh_until)
+                    self.suppressed_count += 1
+                    continue
+
+                blocked_until = self._module_blocked_until(key, interval)
+                if blocked_until is not None:
+                    heap.push(key, max(blocked_until, now + 1))
+                    self.backoff_count += 1
+                    continue
+
+                self._tokens -= 1
+                lag = now - deadline
+                self.last_lag = lag
+                self._lag_total += lag
+                if lag > self.max_lag:
+                    self.max_lag = lag
+                self.read_count += 1
+                processed += 1
+
+                # keep the cadence, but do not try to catch up missed periods
+                next_read_time = deadline + interval
+                heap.push(key, next_read_time if next_read_time > now else now + interval)
+                await self.process_entity_reading(group)
+
+        exhausted = self._tokens < 1 and any(heap and heap.peek()[0] <= now for heap in (self._periodic_heap, self._optional_heap))
+        if exhausted:
+            self.budget_exhausted_count += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG) and processed:
+            _LOGGER.debug(f"Scheduler tick: read {processed} poll groups{', budget exhausted' if exhausted else ''}, last lag {self.last_lag:.2f}s, max lag {self.max_lag:.2f}s")
 
     async def stop(self) -> None:
         """Stop the scheduler."""
-        if self._cancel_timer:
-            self._cancel_timer()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
 
-    async def process_entity_reading(self, entity_id: str, info: EntityInfo, interval: int) -> None:
-        """Process entity reading."""
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug(f"Entity {entity_id} is due for reading")
-        try:
-            _LOGGER.info(f"Reading data from entity {entity_id}")
-            if self.hass.states.get(entity_id):
-                await self.hass.services.async_call(
-                    'homeassistant', 'update_entity', {'entity_id': entity_id}
-                )
-                if entity_id in self.entities_map:
-                    self.entities_map[entity_id].next_read_time = self._now + interval
-            else:
+    async def process_entity_reading(self, group: PollGroup) -> None:
+        """Read the poll group through one member, the response refreshes all of them."""
+        candidates = list(group.members)
+        for entity_id in candidates:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Entity {entity_id} is due for reading (poll group of {len(candidates)})")
+            try:
+                if self.hass.states.get(entity_id):
+                    updater = self._updaters.get(entity_id)
+                    if updater is not None:
+                        # direct call, the state is written by the device updated callback
+                        await updater()
+                    else:
+                        await self.hass.services.async_call(
+                            'homeassistant', 'update_entity', {'entity_id': entity_id}
+                        )
+                    return
                 _LOGGER.warning(f"Entity {entity_id} not found, removing from list")
-                del self.entities_map[entity_id]
-        except Exception as e:
-            _LOGGER.error(f"Error reading entity {entity_id}: {e}")
+                self._remove_entity(entity_id)
+            except Exception as e:
+                _LOGGER.error(f"Error reading entity {entity_id}: {e}")
+                return
 
     async def device_updated(self, entity_id: str, should_reschedule: bool = True) -> None:
         """Update next read time for entity if should_reschedule is True."""
         if entity_id not in self.entities_map:
             return
-        
+
         # Reset scheduler only when requested
         if not should_reschedule:
             return
 
-        current_time = self.hass.loop.time()
-        if current_time - self._now > 1:
-            self._now = current_time
-
-        info = self.entities_map[entity_id]
-        interval = info.scan_interval if info.scan_interval > 0 else self.default_read_interval
-        info.next_read_time = self._now + interval
+        # the device answered, which refreshed the whole poll group
+        group = self.entities_map[entity_id]
+        interval = group.scan_interval if group.scan_interval > 0 else self.default_read_interval
+        self._schedule_group(group, self.hass.loop.time() + interval)
@@ -45,6 +45,8 @@ DEFAULT_CONF_UNIT_OF_MEASUREMENT = ""
 DEFAULT_CONF_DEVICE = "None"
 DEFAULT_CONF_OFFSET = 0
 CONF_OFFSET = "offset"
+CONF_DEADBAND = "deadband"
+DEFAULT_CONF_DEADBAND = 0
 DEFAULT_CONF_SCAN_INTERVAL = 0
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,6 +76,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
                 vol.Optional(CONF_DEVICE, default=DEFAULT_CONF_DEVICE): vol.All(cv.string, validate_device_family),
                 vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_CONF_SCAN_INTERVAL): cv.positive_int,                
                 vol.Optional(CONF_OFFSET, default=DEFAULT_CONF_OFFSET): vol.Coerce(int),
+                vol.Optional(CONF_DEADBAND, default=DEFAULT_CONF_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
                 vol.Optional(CONF_DEVICE_CLASS): DEVICE_CLASSES_SCHEMA,
             })
         ])
@@ -97,6 +100,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
         sensor_type_str = device_config[CONF_TYPE]
         device_family_str = device_config[CONF_DEVICE]
         offset = device_config[CONF_OFFSET]
+        deadband = device_config[CONF_DEADBAND]
         scan_interval = device_config[CONF_SCAN_INTERVAL]
         device_class = device_config.get(CONF_DEVICE_CLASS)
 
@@ -124,7 +128,8 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(f"Adding sensor '{name}' with address {device_address}, sensor type '{sensor_type}'")
-        sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type, name=name, channel_number=channel_number)
+        deadbands = {sensor_type: deadband} if deadband else None
+        sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type, name=name, channel_number=channel_number, deadbands=deadbands)
         devices.append(BusproSensor(hass, sensor, sensor_type, scan_interval, offset, device_class))
 
 
@@ -177,7 +182,7 @@ class BusproSensor(SensorEntity):
     @property
     def available(self):
         """Return True if entity is available."""
-        connected = self._hass.data[DATA_BUSPRO].connected
+        connected = self._hass.data[DATA_BUSPRO].connected and self._device.available
 
         if self._sensor_type == SensorType.TEMPERATURE:
             return connected and self._device._current_temperature is not None
@@ -0,0 +1,73 @@
+"""Persisted snapshot of last known Buspro device state."""
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = "buspro.snapshot"
+SAVE_DELAY = 30  # seconds, changes within this window are written together
+
+
+class StateSnapshot:
+    """Last known state of devices, keyed by module address and device snapshot key.
+
+    Devices report every real state change; the store is written debounced,
+    so a burst of updates results in one write. On boot devices are hydrated
+    from the snapshot before their first read is sent.
+    """
+    def __init__(self, hass: HomeAssistant):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data = {}     # "subnet.device" -> {snapshot key: state}
+        self._dirty = set()
+        self.restored_count = 0
+
+    async def async_load(self) -> None:
+        """Load snapshot from disk."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning(f"Cannot load state snapshot: {e}")
+            data = None
+        self._data = data if isinstance(data, dict) else {}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Loaded state snapshot of {len(self._data)} modules")
+
+    @staticmethod
+    def _module_key(device) -> str:
+        subnet_id, device_id = device._device_address[:2]
+        return f"{subnet_id}.{device_id}"
+
+    def restore(self, device) -> bool:
+        """Hydrate device from snapshot, return True if a state was found."""
+        key = device.snapshot_key
+        if key is None:
+            return False
+        state = self._data.get(self._module_key(device), {}).get(key)
+        if not state:
+            return False
+        try:
+            device.restore_snapshot(state)
+        except (KeyError, ValueError, TypeError) as e:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Ignoring snapshot of {self._module_key(device)} {key}: {e}")
+            return False
+        self.restored_count += 1
+        return True
+
+    def device_updated(self, device) -> None:
+        """Mark device state for the next debounced write."""
+        if device.snapshot_key is None:
+            return
+        self._dirty.add(device)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        dirty, self._dirty = self._dirty, set()
+        for device in dirty:
+            state = device.snapshot_state()
+            if state:
+                self._data.setdefault(self._module_key(device), {})[device.snapshot_key] = state
+        return self._data
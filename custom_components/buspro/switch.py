@@ -129,7 +129,7 @@ class BusproSwitch(SwitchEntity):
     @property
     def available(self):
         """Return True if entity is available."""
-        return self._hass.data[DATA_BUSPRO].connected
+        return self._hass.data[DATA_BUSPRO].connected and self._device.available
 
     @property
     def is_on(self):
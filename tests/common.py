@@ -0,0 +1,62 @@
+"""Fakes shared by the tests."""
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.buspro.pybuspro.core.broadcast_freshness import BroadcastFreshnessTracker
+from custom_components.buspro.pybuspro.core.module_health import ModuleHealthMonitor
+
+START = 1000.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def time(self):
+        return self.now
+
+
+class FakeHass:
+    """Just enough of Home Assistant for the scheduler: clock, states and update service."""
+
+    def __init__(self):
+        self.loop = FakeClock()
+        self.data = {}
+        self.reads = []
+        self.entity_ids = set()
+        self.states = SimpleNamespace(get=lambda entity_id: entity_id in self.entity_ids or None)
+        self.services = SimpleNamespace(async_call=self._update_entity)
+
+    async def _update_entity(self, domain, service, data):
+        self.reads.append(data["entity_id"])
+
+
+class FakeEntity:
+    def __init__(self, hass, entity_id, scan_interval, read_key=None):
+        self.entity_id = entity_id
+        self.scan_interval = scan_interval
+        self._hass = hass
+        if read_key is not None:
+            self._device = SimpleNamespace(read_status_key=read_key)
+        hass.entity_ids.add(entity_id)
+
+    async def async_update(self):
+        self._hass.reads.append(self.entity_id)
+
+
+def tick(hass, scheduler, at):
+    """Process everything due at START + at, return the entity ids read."""
+    hass.loop.now = START + at
+    hass.reads.clear()
+    asyncio.run(scheduler._process_due_entities())
+    return list(hass.reads)
+
+
+def fake_hdl(hass):
+    """Register the Buspro parts the scheduler consults, driven by the hass clock."""
+    hdl = SimpleNamespace(
+        broadcast_freshness=BroadcastFreshnessTracker(hass.loop),
+        module_health=ModuleHealthMonitor(hass.loop),
+    )
+    hass.data["buspro"] = SimpleNamespace(hdl=hdl)
+    return hdl
@@ -0,0 +1,19 @@
+"""Test setup.
+
+The library under custom_components/buspro/pybuspro does not need Home
+Assistant. Without Home Assistant installed, the integration package is
+registered without running its __init__, so the library modules can be
+imported and tested on their own.
+"""
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if importlib.util.find_spec("homeassistant") is None:
+    for name in ("custom_components", "custom_components.buspro"):
+        package = types.ModuleType(name)
+        package.__path__ = [str(ROOT.joinpath(*name.split(".")))]
+        sys.modules.setdefault(name, package)
@@ -0,0 +1,87 @@
+"""Broadcasts standing in for status reads."""
+import asyncio
+
+import pytest
+
+from custom_components.buspro.pybuspro.core.broadcast_freshness import BroadcastFreshnessTracker
+from custom_components.buspro.pybuspro.core.telegram import Telegram
+from custom_components.buspro.pybuspro.helpers.enums import OperateCode
+from custom_components.buspro.scheduler import Scheduler
+
+from .common import START, FakeClock, FakeEntity, FakeHass, fake_hdl, tick
+
+TEMPERATURE_READ = (1, 20, OperateCode.ReadTemperatureStatus, (2,))
+TWELVE_IN_ONE_READ = (1, 30, OperateCode.Read12in1SensorStatus, ())
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(clock):
+    return BroadcastFreshnessTracker(clock)
+
+
+def _broadcast(source_address, operate_code, payload):
+    telegram = Telegram()
+    telegram.source_address = source_address
+    telegram.operate_code = operate_code
+    telegram.payload = list(payload)
+    return telegram
+
+
+def test_broadcast_replaces_read_for_its_channel(tracker, clock):
+    tracker.observe(_broadcast((1, 20), OperateCode.BroadcastTemperatureResponse, [2, 21]))
+
+    assert tracker.fresh_until(TEMPERATURE_READ, 60) == clock.now + 60
+    assert tracker.fresh_until((1, 20, OperateCode.ReadTemperatureStatus, (3,)), 60) is None
+    assert tracker.fresh_until((1, 21, OperateCode.ReadTemperatureStatus, (2,)), 60) is None
+
+
+def test_module_wide_broadcast_replaces_read(tracker, clock):
+    tracker.observe(_broadcast((1, 30), OperateCode.Broadcast12in1SensorStatusAutoResponse, [0xF8] + [0] * 7))
+
+    assert tracker.fresh_until(TWELVE_IN_ONE_READ, 30) == clock.now + 30
+    assert tracker.broadcasting_count == 1
+
+
+def test_stale_broadcast_needs_a_read(tracker, clock):
+    tracker.observe(_broadcast((1, 20), OperateCode.BroadcastTemperatureResponse, [2, 21]))
+    clock.now += 60
+
+    assert tracker.fresh_until(TEMPERATURE_READ, 60) is None
+
+
+def test_other_telegrams_are_ignored(tracker):
+    tracker.observe(_broadcast((1, 20), OperateCode.ReadTemperatureStatusResponse, [2, 21]))
+    tracker.observe(_broadcast((1, 20), OperateCode.BroadcastTemperatureResponse, []))
+
+    assert tracker.broadcasting_count == 0
+    assert tracker.observed_count == 0
+    assert tracker.fresh_until("light.entity_id_key", 60) is None
+
+
+def test_period_is_learned_from_intervals(tracker, clock):
+    for _ in range(3):
+        tracker.observe(_broadcast((1, 20), OperateCode.BroadcastTemperatureResponse, [2, 21]))
+        clock.now += 10
+
+    assert tracker.state_for(TEMPERATURE_READ).period == pytest.approx(10)
+    assert tracker.state_for(TEMPERATURE_READ).count == 3
+
+
+def test_scheduler_skips_reads_while_broadcasts_are_fresh():
+    hass = FakeHass()
+    tracker = fake_hdl(hass).broadcast_freshness
+    scheduler = Scheduler(hass)
+    asyncio.run(scheduler.add_entity(FakeEntity(hass, "sensor.temperature", 30, TEMPERATURE_READ)))
+
+    hass.loop.now = START + 20
+    tracker.observe(_broadcast((1, 20), OperateCode.BroadcastTemperatureResponse, [2, 21]))
+    assert tick(hass, scheduler, 30) == []
+    assert scheduler.suppressed_count == 1
+    # no broadcast since, the read is due when the broadcast gets stale
+    assert tick(hass, scheduler, 49) == []
+    assert tick(hass, scheduler, 50) == ["sensor.temperature"]
@@ -0,0 +1,38 @@
+"""CRC backends of the telegram checksum."""
+import pytest
+
+from custom_components.buspro.pybuspro.helpers.crc import (
+    CRC_BACKEND_BINASCII,
+    CRC_BACKEND_TABLE,
+    DEFAULT_CRC_BACKEND,
+    available_crc_backends,
+    crc16_binascii,
+    get_crc_function,
+)
+
+FRAMES = [
+    b"",
+    b"123456789",
+    bytes(range(16, 16 + 22)),
+    bytes([0x0F, 0x01, 0x4A, 0x00, 0x11, 0x00, 0x31, 0x01, 0x02, 0x01, 0x64, 0x00, 0x00]),
+]
+
+
+def test_xmodem_check_value():
+    assert crc16_binascii(b"123456789") == 0x31C3
+
+
+@pytest.mark.parametrize("name", sorted(available_crc_backends()))
+@pytest.mark.parametrize("data", FRAMES)
+def test_backends_agree(name, data):
+    func = available_crc_backends()[name]
+    expected = crc16_binascii(data)
+    assert func(data) == expected
+    assert func(bytearray(data)) == expected
+    assert func(memoryview(data)) == expected
+
+
+def test_unknown_backend_falls_back_to_default():
+    assert get_crc_function("missing") is available_crc_backends()[DEFAULT_CRC_BACKEND]
+    assert get_crc_function(CRC_BACKEND_TABLE) is available_crc_backends()[CRC_BACKEND_TABLE]
+    assert DEFAULT_CRC_BACKEND == CRC_BACKEND_BINASCII
@@ -0,0 +1,137 @@
+"""Routing of received telegrams to device callbacks."""
+import asyncio
+
+import pytest
+
+from custom_components.buspro.pybuspro.buspro import Buspro
+from custom_components.buspro.pybuspro.core.telegram import Telegram, address_key
+from custom_components.buspro.pybuspro.helpers.enums import OperateCode
+
+MODULE = (1, 74)
+OTHER_MODULE = (1, 75)
+
+
+@pytest.fixture
+def buspro():
+    loop = asyncio.new_event_loop()
+    yield Buspro(None, (("127.0.0.1", 6000), ("", 6000)), loop)
+    loop.close()
+
+
+def _telegram(source_address, operate_code, payload=()):
+    telegram = Telegram()
+    telegram.source_address = source_address
+    telegram.operate_code = operate_code
+    telegram.payload = list(payload)
+    return telegram
+
+
+class Recorder:
+    def __init__(self):
+        self.telegrams = []
+
+    def __call__(self, telegram):
+        self.telegrams.append(telegram)
+
+    @property
+    def operate_codes(self):
+        return [telegram.operate_code for telegram in self.telegrams]
+
+
+def test_callbacks_receive_their_operate_codes(buspro):
+    light = Recorder()
+    everything = Recorder()
+    buspro.register_telegram_received_device_cb(light, MODULE, (OperateCode.SingleChannelControlResponse,))
+    buspro.register_telegram_received_device_cb(everything, MODULE)
+
+    for operate_code in (OperateCode.SingleChannelControlResponse, OperateCode.ReadStatusOfChannelsResponse):
+        buspro._callback_all_messages(_telegram(MODULE, operate_code))
+
+    assert light.operate_codes == [OperateCode.SingleChannelControlResponse]
+    assert everything.operate_codes == [OperateCode.SingleChannelControlResponse,
+                                        OperateCode.ReadStatusOfChannelsResponse]
+
+
+def test_other_modules_and_time_broadcasts_are_not_dispatched(buspro):
+    everything = Recorder()
+    buspro.register_telegram_received_device_cb(everything, MODULE)
+
+    buspro._callback_all_messages(_telegram(OTHER_MODULE, OperateCode.ReadStatusOfChannelsResponse))
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.BroadcastSystemDateandTimeEveryMinute))
+
+    assert everything.telegrams == []
+
+
+def test_unregister_rebuilds_the_index(buspro):
+    light = Recorder()
+    switch = Recorder()
+    buspro.register_telegram_received_device_cb(light, MODULE, (OperateCode.SingleChannelControlResponse,))
+    buspro.register_telegram_received_device_cb(switch, MODULE, (OperateCode.SingleChannelControlResponse,))
+
+    buspro.unregister_telegram_received_device_cb(light, MODULE)
+    buspro.unregister_telegram_received_device_cb(light, MODULE)
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.SingleChannelControlResponse))
+    assert light.telegrams == []
+    assert len(switch.telegrams) == 1
+
+    buspro.unregister_telegram_received_device_cb(switch, MODULE)
+    assert address_key(MODULE) not in buspro._dispatch_index
+
+
+def test_telegram_filter_passes_subscribed_sources_only(buspro):
+    buspro.register_telegram_received_device_cb(Recorder(), MODULE)
+
+    assert buspro._wants_telegram(address_key(MODULE))
+    assert not buspro._wants_telegram(address_key(OTHER_MODULE))
+
+    buspro.register_telegram_received_all_messages_cb(Recorder())
+    assert buspro._wants_telegram(address_key(OTHER_MODULE))
+
+
+def test_channel_addressed_responses_reach_the_owning_channel_only(buspro):
+    channel_1 = Recorder()
+    channel_2 = Recorder()
+    for recorder, channel in ((channel_1, 1), (channel_2, 2)):
+        buspro.register_telegram_received_device_cb(
+            recorder, MODULE, (OperateCode.SingleChannelControlResponse,), channel=channel)
+
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.SingleChannelControlResponse, [2, 0xF8, 100]))
+
+    assert channel_1.telegrams == []
+    assert len(channel_2.telegrams) == 1
+
+
+def test_channel_index_follows_the_payload_layout(buspro):
+    dry_contact_2 = Recorder()
+    buspro.register_telegram_received_device_cb(
+        dry_contact_2, MODULE, (OperateCode.ReadDryContactStatusResponse,), channel=2)
+
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.ReadDryContactStatusResponse, [0xF8, 2, 1]))
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.ReadDryContactStatusResponse, [0xF8, 1, 1]))
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.ReadDryContactStatusResponse, [2]))
+
+    assert [telegram.payload[1] for telegram in dry_contact_2.telegrams] == [2]
+
+
+def test_channel_status_frame_reaches_channels_it_contains(buspro):
+    channel_2 = Recorder()
+    channel_5 = Recorder()
+    for recorder, channel in ((channel_2, 2), (channel_5, 5)):
+        buspro.register_telegram_received_device_cb(
+            recorder, MODULE, (OperateCode.ReadStatusOfChannelsResponse,), channel=channel)
+
+    # four channels in the frame
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.ReadStatusOfChannelsResponse, [4, 0, 100, 0, 0]))
+
+    assert len(channel_2.telegrams) == 1
+    assert channel_5.telegrams == []
+
+
+def test_channel_callback_still_gets_module_wide_operate_codes(buspro):
+    channel_1 = Recorder()
+    buspro.register_telegram_received_device_cb(
+        channel_1, MODULE, (OperateCode.SingleChannelControlResponse, OperateCode.SceneControlResponse), channel=1)
+
+    buspro._callback_all_messages(_telegram(MODULE, OperateCode.SceneControlResponse, [1, 2]))
+
+    assert channel_1.operate_codes == [OperateCode.SceneControlResponse]
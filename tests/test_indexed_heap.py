@@ -0,0 +1,58 @@
+"""Deadline heap of the scheduler."""
+import random
+
+from custom_components.buspro.scheduler import IndexedHeap
+
+
+def _drain(heap):
+    result = []
+    while heap:
+        result.append(heap.pop())
+    return result
+
+
+def test_pop_in_deadline_order():
+    heap = IndexedHeap()
+    for key, deadline in (("a", 3.0), ("b", 1.0), ("c", 2.0)):
+        heap.push(key, deadline)
+    assert heap.peek() == (1.0, "b")
+    assert _drain(heap) == [(1.0, "b"), (2.0, "c"), (3.0, "a")]
+    assert heap.peek() is None
+
+
+def test_push_moves_queued_key():
+    heap = IndexedHeap()
+    for key, deadline in (("a", 1.0), ("b", 2.0), ("c", 3.0)):
+        heap.push(key, deadline)
+    heap.push("c", 0.5)     # decrease
+    heap.push("a", 4.0)     # increase
+    assert len(heap) == 3
+    assert heap.deadline("a") == 4.0
+    assert _drain(heap) == [(0.5, "c"), (2.0, "b"), (4.0, "a")]
+
+
+def test_remove():
+    heap = IndexedHeap()
+    for key, deadline in (("a", 1.0), ("b", 2.0), ("c", 3.0), ("d", 4.0)):
+        heap.push(key, deadline)
+    assert heap.remove("b")
+    assert not heap.remove("b")
+    assert "b" not in heap
+    assert heap.deadline("b") is None
+    assert _drain(heap) == [(1.0, "a"), (3.0, "c"), (4.0, "d")]
+
+
+def test_random_operations_match_sorted_reference():
+    rng = random.Random(4)
+    heap = IndexedHeap()
+    reference = {}
+    for _ in range(2000):
+        key = rng.randrange(50)
+        if rng.random() < 0.3:
+            assert heap.remove(key) == (reference.pop(key, None) is not None)
+        else:
+            deadline = rng.random()
+            heap.push(key, deadline)
+            reference[key] = deadline
+        assert len(heap) == len(reference)
+    assert _drain(heap) == sorted((deadline, key) for key, deadline in reference.items())
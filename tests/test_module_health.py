@@ -0,0 +1,157 @@
+"""Circuit breaker of modules that stop responding."""
+import asyncio
+
+import pytest
+
+from custom_components.buspro.pybuspro.core.module_health import (
+    BROADCAST_KEY,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    ModuleHealthMonitor,
+)
+from custom_components.buspro.pybuspro.core.telegram import address_key
+from custom_components.buspro.scheduler import Scheduler
+
+from .common import START, FakeClock, FakeEntity, FakeHass, fake_hdl, tick
+
+MODULE = address_key((1, 74))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def changes():
+    return []
+
+
+@pytest.fixture
+def monitor(clock, changes):
+    return ModuleHealthMonitor(clock, lambda key, available: changes.append((key, available)))
+
+
+def _unanswered(monitor, clock, windows):
+    for _ in range(windows):
+        monitor.request_sent(MODULE)
+        clock.now += monitor.response_timeout
+
+
+def _open(monitor, clock):
+    """Let the breaker open and wait until the probe is allowed."""
+    _unanswered(monitor, clock, monitor.failure_threshold)
+    # timeouts are evaluated when the module is asked about
+    assert not monitor.allow_request(MODULE)
+    clock.now = monitor.retry_at(MODULE)
+
+
+def test_answered_requests_keep_the_module_available(monitor, clock):
+    for _ in range(5):
+        monitor.request_sent(MODULE)
+        clock.now += 1
+        monitor.response_received(MODULE)
+        clock.now += monitor.response_timeout
+
+    health = monitor.health(MODULE)
+    assert (health.requests, health.responses, health.failures) == (5, 5, 0)
+    assert monitor.is_available(MODULE)
+
+
+def test_breaker_opens_after_unanswered_requests(monitor, clock, changes):
+    _unanswered(monitor, clock, monitor.failure_threshold - 1)
+    assert monitor.allow_request(MODULE)
+
+    _unanswered(monitor, clock, 1)
+    assert not monitor.allow_request(MODULE)
+    assert not monitor.is_available(MODULE)
+    assert monitor.health(MODULE).state == STATE_OPEN
+    assert monitor.retry_at(MODULE) == clock.now + monitor.base_backoff
+    assert changes == [(MODULE, False)]
+
+
+def test_probe_answer_closes_the_breaker(monitor, clock, changes):
+    _open(monitor, clock)
+
+    assert monitor.allow_request(MODULE)
+    assert monitor.health(MODULE).state == STATE_HALF_OPEN
+    monitor.request_sent(MODULE)
+    assert not monitor.allow_request(MODULE)
+
+    monitor.response_received(MODULE)
+    assert monitor.health(MODULE).state == STATE_CLOSED
+    assert monitor.allow_request(MODULE)
+    assert changes == [(MODULE, False), (MODULE, True)]
+
+
+def test_unanswered_probe_doubles_the_backoff(monitor, clock, changes):
+    _open(monitor, clock)
+
+    assert monitor.allow_request(MODULE)
+    _unanswered(monitor, clock, 1)
+    assert not monitor.allow_request(MODULE)
+    assert monitor.health(MODULE).state == STATE_OPEN
+    assert monitor.retry_at(MODULE) == clock.now + 2 * monitor.base_backoff
+    assert changes == [(MODULE, False)]
+
+
+def test_backoff_is_capped(monitor, clock):
+    _open(monitor, clock)
+    backoffs = []
+    for _ in range(7):
+        assert monitor.allow_request(MODULE)
+        _unanswered(monitor, clock, 1)
+        assert not monitor.allow_request(MODULE)
+        backoffs.append(monitor.retry_at(MODULE) - clock.now)
+        clock.now = monitor.retry_at(MODULE)
+
+    assert backoffs == [60, 120, 240, 480, 900, 900, 900]
+
+
+def test_broadcast_address_is_not_tracked(monitor):
+    monitor.request_sent(BROADCAST_KEY)
+    assert monitor.health(BROADCAST_KEY) is None
+    assert monitor.allow_request(BROADCAST_KEY)
+
+
+def test_scheduler_holds_back_reads_of_an_open_module():
+    hass = FakeHass()
+    health = fake_hdl(hass).module_health
+    scheduler = Scheduler(hass)
+    read_key = (1, 74, "ReadStatusOfChannels", ())
+    asyncio.run(scheduler.add_entity(FakeEntity(hass, "light.a", 10, read_key)))
+
+    _unanswered(health, hass.loop, health.failure_threshold)
+    elapsed = hass.loop.now - START
+    assert tick(hass, scheduler, max(elapsed, 10)) == []
+    assert scheduler.backoff_count == 1
+
+    assert tick(hass, scheduler, max(elapsed, 10) + health.base_backoff) == ["light.a"]
+
+
+def test_buspro_reports_availability_changes():
+    from custom_components.buspro.pybuspro.buspro import Buspro
+    from custom_components.buspro.pybuspro.core.telegram import Telegram
+    from custom_components.buspro.pybuspro.helpers.enums import OperateCode
+
+    clock = FakeClock()
+    buspro = Buspro(None, (("127.0.0.1", 6000), ("", 6000)), clock)
+    changes = []
+    buspro.register_availability_cb(changes.append, (1, 74))
+
+    read = Telegram()
+    read.target_address = (1, 74)
+    for _ in range(buspro.module_health.failure_threshold):
+        buspro._telegram_sent(read)
+        clock.now += buspro.module_health.response_timeout
+    assert not buspro.is_module_available((1, 74))
+    assert changes == [False]
+
+    response = Telegram()
+    response.source_address = (1, 74)
+    response.operate_code = OperateCode.ReadStatusOfChannelsResponse
+    response.payload = [0]
+    buspro._callback_all_messages(response)
+    assert buspro.is_module_available((1, 74))
+    assert changes == [False, True]
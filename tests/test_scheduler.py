@@ -0,0 +1,78 @@
+"""Deadline driven polling of the scheduler."""
+import asyncio
+
+from custom_components.buspro.scheduler import MAX_IDLE_SLEEP, Scheduler
+
+from .common import START, FakeEntity, FakeHass, tick
+
+
+def _scheduler(read_budget=10, entities=()):
+    hass = FakeHass()
+    scheduler = Scheduler(hass, read_budget)
+    for entity_id, scan_interval in entities:
+        asyncio.run(scheduler.add_entity(FakeEntity(hass, entity_id, scan_interval)))
+    return hass, scheduler
+
+
+def test_reads_are_limited_by_the_budget():
+    hass, scheduler = _scheduler(2, [("light.a", 5), ("light.b", 5), ("light.c", 5)])
+
+    assert len(tick(hass, scheduler, 5)) == 2
+    assert scheduler.budget_exhausted_count == 1
+    # half a second refills one token at two reads per second
+    assert len(tick(hass, scheduler, 5.5)) == 1
+    assert scheduler.read_count == 3
+
+
+def test_entities_with_scan_interval_are_served_first():
+    hass, scheduler = _scheduler(1, [("sensor.optional", 0), ("light.periodic", 10)])
+
+    assert tick(hass, scheduler, 10) == ["light.periodic"]
+    assert tick(hass, scheduler, 11) == ["sensor.optional"]
+
+
+def test_cadence_is_kept_without_catching_up():
+    hass, scheduler = _scheduler(entities=[("light.a", 10)])
+
+    assert tick(hass, scheduler, 10) == ["light.a"]
+    assert tick(hass, scheduler, 19.9) == []
+    assert tick(hass, scheduler, 20) == ["light.a"]
+    # late by more than one period: one read, next one a full interval later
+    assert tick(hass, scheduler, 45) == ["light.a"]
+    assert tick(hass, scheduler, 50) == []
+    assert tick(hass, scheduler, 55) == ["light.a"]
+    assert scheduler.max_lag == 15
+
+
+def test_next_delay():
+    hass, scheduler = _scheduler(1)
+    assert scheduler._next_delay() == MAX_IDLE_SLEEP
+
+    for entity_id in ("light.a", "light.b"):
+        asyncio.run(scheduler.add_entity(FakeEntity(hass, entity_id, 5)))
+    assert scheduler._next_delay() == 5
+
+    tick(hass, scheduler, 5)
+    # light.b is due, but the only token was spent
+    assert scheduler._next_delay() == 1
+
+
+def test_device_update_pushes_the_read_back():
+    hass, scheduler = _scheduler(entities=[("light.a", 10)])
+
+    hass.loop.now = START + 8
+    asyncio.run(scheduler.device_updated("light.a"))
+    assert tick(hass, scheduler, 10) == []
+    assert tick(hass, scheduler, 18) == ["light.a"]
+
+    hass.loop.now = START + 20
+    asyncio.run(scheduler.device_updated("light.a", should_reschedule=False))
+    assert tick(hass, scheduler, 28) == ["light.a"]
+
+
+def test_missing_entity_is_dropped():
+    hass, scheduler = _scheduler(entities=[("light.a", 10)])
+    hass.entity_ids.clear()
+
+    assert tick(hass, scheduler, 10) == []
+    assert scheduler.lag_stats()["entities"] == 0
@@ -0,0 +1,113 @@
+"""Tests for the persisted device state snapshot."""
+import asyncio
+import importlib
+import importlib.util
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.buspro.pybuspro.core.telegram import Telegram
+from custom_components.buspro.pybuspro.core.warmup import WarmupOrchestrator
+from custom_components.buspro.pybuspro.devices.light import Light
+from custom_components.buspro.pybuspro.devices.security import Security
+from custom_components.buspro.pybuspro.helpers.enums import OperateCode
+
+from .common import FakeClock
+
+MODULE = (1, 74)
+
+
+class FakeStore:
+    def __init__(self, hass, version, key):
+        self.data = None
+        self.saved = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.saved = data_func
+
+
+@pytest.fixture
+def snapshot_module(monkeypatch):
+    """Import the snapshot module with FakeStore in place of the Home Assistant store."""
+    if importlib.util.find_spec("homeassistant") is None:
+        for name in ("homeassistant", "homeassistant.core", "homeassistant.helpers", "homeassistant.helpers.storage"):
+            monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+        sys.modules["homeassistant.core"].HomeAssistant = object
+        sys.modules["homeassistant.helpers.storage"].Store = FakeStore
+        monkeypatch.delitem(sys.modules, "custom_components.buspro.snapshot", raising=False)
+    module = importlib.import_module("custom_components.buspro.snapshot")
+    monkeypatch.setattr(module, "Store", FakeStore)
+    return module
+
+
+class FakeBuspro:
+    def __init__(self, snapshot):
+        self.updated = []
+        self.hdl = SimpleNamespace(
+            warmup=WarmupOrchestrator(FakeClock()),
+            update_coalescer=SimpleNamespace(device_updated=lambda device, reschedule: self.updated.append(device)),
+            register_telegram_received_device_cb=lambda *args: None,
+            register_availability_cb=lambda *args: None,
+        )
+        self.snapshot = snapshot
+
+
+def _hass(snapshot):
+    return SimpleNamespace(data={"buspro": FakeBuspro(snapshot)})
+
+
+def _load(snapshot_module, data):
+    snapshot = snapshot_module.StateSnapshot(None)
+    snapshot._store.data = data
+    asyncio.run(snapshot.async_load())
+    return snapshot
+
+
+def test_state_survives_restart(snapshot_module):
+    snapshot = _load(snapshot_module, None)
+    light = Light(_hass(snapshot), MODULE, 3)
+    light._brightness = 70
+    light._previous_brightness = 70
+    light._call_device_updated()
+    saved = snapshot._store.saved()
+    assert saved == {"1.74": {"light.3": {"brightness": 70, "previous_brightness": 70}}}
+
+    snapshot = _load(snapshot_module, saved)
+    hass = _hass(snapshot)
+    light = Light(hass, MODULE, 3)
+    other_channel = Light(hass, MODULE, 4)
+    assert light.current_brightness == 70
+    assert other_channel.current_brightness == 0
+    assert snapshot.restored_count == 1
+    # restored state is still verified by the warm-up read
+    assert hass.data["buspro"].hdl.warmup.stats()["devices_waiting"] == 2
+
+
+def test_first_bus_answer_is_reported_after_restore(snapshot_module):
+    snapshot = _load(snapshot_module, {"1.74": {"light.1": {"brightness": 40}}})
+    hass = _hass(snapshot)
+    light = Light(hass, MODULE, 1)
+
+    telegram = Telegram()
+    telegram.source_address = MODULE
+    telegram.operate_code = OperateCode.ReadStatusOfChannelsResponse
+    telegram.payload = [1, 40]
+    light._telegram_received_cb(telegram)
+    assert hass.data["buspro"].updated == [light]
+
+
+def test_invalid_state_is_ignored(snapshot_module):
+    snapshot = _load(snapshot_module, {"1.74": {"security.1": {"status": 99}}})
+    security = Security(_hass(snapshot), MODULE, 1)
+    assert security.status is None
+    assert snapshot.restored_count == 0
+
+
+def test_unreadable_store_starts_empty(snapshot_module):
+    snapshot = _load(snapshot_module, ["not", "a", "dict"])
+    assert snapshot._data == {}
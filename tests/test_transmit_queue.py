@@ -0,0 +1,107 @@
+"""Priority queue and pacing in front of the gateway socket."""
+import asyncio
+
+import pytest
+
+from custom_components.buspro.pybuspro.helpers.enums import TransmitPriority
+from custom_components.buspro.pybuspro.transport.transmit_queue import FRAME_BURST, TransmitQueue
+
+from .common import FakeClock
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _queue(transmit, **kwargs):
+    kwargs.setdefault("frame_rate", 1000)
+    kwargs.setdefault("frame_gap", 0)
+    return TransmitQueue(asyncio.get_running_loop(), transmit, **kwargs)
+
+
+def test_sends_in_priority_order():
+    async def main():
+        sent = []
+
+        async def transmit(telegram):
+            sent.append(telegram)
+
+        queue = await _queue(transmit)
+        sends = [
+            asyncio.create_task(queue.send("poll", TransmitPriority.POLL)),
+            asyncio.create_task(queue.send("background", TransmitPriority.BACKGROUND)),
+            asyncio.create_task(queue.send("user 1", TransmitPriority.USER)),
+            asyncio.create_task(queue.send("user 2", TransmitPriority.USER)),
+        ]
+        await asyncio.sleep(0)
+        queue.start()
+        await asyncio.gather(*sends)
+        await queue.stop()
+        return sent, queue.metrics()
+
+    sent, metrics = _run(main())
+    assert sent == ["user 1", "user 2", "poll", "background"]
+    assert metrics["user"]["sent"] == 2
+    assert metrics["user"]["max_depth"] == 2
+    assert metrics["poll"]["depth"] == 0
+
+
+def test_frame_rate_allows_a_short_burst():
+    clock = FakeClock()
+    queue = TransmitQueue(clock, None, frame_rate=10, frame_gap=0)
+    for _ in range(FRAME_BURST):
+        assert queue._pacing_delay(clock.now) == 0
+        queue._tokens -= 1
+    assert queue._pacing_delay(clock.now) == pytest.approx(0.1)
+    clock.now += 0.1
+    assert queue._pacing_delay(clock.now) == pytest.approx(0)
+
+
+def test_frame_gap_paces_transmission():
+    async def main():
+        loop = asyncio.get_running_loop()
+        times = []
+
+        async def transmit(telegram):
+            times.append(loop.time())
+
+        queue = await _queue(transmit, frame_gap=0.05)
+        queue.start()
+        await asyncio.gather(*(queue.send(n) for n in range(3)))
+        await queue.stop()
+        return times
+
+    times = _run(main())
+    assert all(later - earlier >= 0.045 for earlier, later in zip(times, times[1:]))
+
+
+def test_stop_cancels_queued_sends():
+    async def main():
+        async def transmit(telegram):
+            pass
+
+        queue = await _queue(transmit)
+        send = asyncio.create_task(queue.send("poll", TransmitPriority.POLL))
+        await asyncio.sleep(0)
+        await queue.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await send
+
+    _run(main())
+
+
+def test_transmit_error_reaches_the_sender():
+    async def main():
+        async def transmit(telegram):
+            raise OSError("network unreachable")
+
+        queue = await _queue(transmit)
+        queue.start()
+        with pytest.raises(OSError):
+            await queue.send("command")
+        # the queue keeps running after a failed transmission
+        with pytest.raises(OSError):
+            await queue.send("command")
+        await queue.stop()
+
+    _run(main())
@@ -0,0 +1,85 @@
+"""Tests for the warm-up pipeline of initial reads."""
+import asyncio
+
+from custom_components.buspro.pybuspro.core.warmup import WarmupOrchestrator
+
+from .common import FakeClock
+
+
+class FakeControl:
+    def __init__(self, request_key, sent):
+        self.request_key = request_key
+        self._sent = sent
+
+    async def send(self):
+        self._sent.append(self.request_key)
+
+
+def _read(module, channel=0):
+    return (*module, 0x0033, (channel,))
+
+
+def test_same_read_is_sent_once():
+    async def scenario():
+        sent = []
+        warmup = WarmupOrchestrator(asyncio.get_running_loop(), rate=1000)
+        key = _read((1, 10))
+        for device in ("light 1", "light 2", "light 3"):
+            warmup.request_initial_read(device, FakeControl(key, sent))
+        warmup.request_initial_read("sensor", FakeControl(_read((1, 20)), sent))
+        assert sent == []
+
+        warmup.start()
+        while warmup.stats()["reads_queued"]:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        return sent, warmup
+
+    sent, warmup = asyncio.run(scenario())
+    assert sent == [_read((1, 10)), _read((1, 20))]
+    assert warmup.sent_count == 2
+    assert warmup.deduplicated_count == 2
+
+
+def test_control_without_request_key_is_ignored():
+    warmup = WarmupOrchestrator(FakeClock())
+    warmup.request_initial_read("device", FakeControl(None, []))
+    assert warmup.stats()["devices_waiting"] == 0
+    assert warmup.reads_progress == (0, 0)
+
+
+def test_progress_and_first_state_times():
+    clock = FakeClock()
+    warmup = WarmupOrchestrator(clock)
+    warmup._kick = lambda: None
+    warmup.request_initial_read("light 1", FakeControl(_read((1, 10)), []))
+    warmup.request_initial_read("light 2", FakeControl(_read((1, 10)), []))
+    warmup.request_initial_read("sensor", FakeControl(_read((1, 20), 1), []))
+    warmup._queue.clear()
+
+    # state arriving before start() is not a warm-up answer
+    warmup.device_updated("light 1")
+    assert warmup.modules_progress == (0, 2)
+
+    warmup.request_initial_read("light 1", FakeControl(_read((1, 10)), []))
+    warmup.start()
+    start = clock.now
+    clock.now = start + 1
+    warmup.device_updated("light 1")
+    clock.now = start + 3
+    warmup.device_updated("light 2")
+    assert warmup.modules_progress == (1, 2)
+    assert warmup.reads_progress == (1, 2)
+    assert warmup.finished_at is None
+
+    clock.now = start + 5
+    warmup.device_updated("sensor")
+    assert warmup.modules_progress == (2, 2)
+    assert warmup.first_state_count == 3
+    assert warmup.first_state_average == 3.0
+    assert warmup.first_state_max == 5.0
+    assert warmup.finished_at == start + 5
+
+    # a later update of an answered device is not counted again
+    warmup.device_updated("sensor")
+    assert warmup.first_state_count == 3